@@ -35,7 +35,8 @@ class AppWindow(QMainWindow):
         self._app = app
         self._theme = theme
         self.state = AppState()
-        self.state.dirtyChanged.connect(self._update_window_title)
+        # Queued : la frappe (echo/paint) passe avant la mise à jour du titre
+        self.state.dirtyChanged.connect(self._update_window_title, Qt.QueuedConnection)
 
         self._build_ui()
         self._build_menu()
@@ -213,6 +214,8 @@ class AppWindow(QMainWindow):
             pass
 
     def closeEvent(self, event) -> None:
+        self.state.flush_pending_edits()
+
         # Si rien n'a changé, on ferme direct
         if not self.state.is_dirty:
             event.accept()
@@ -274,6 +277,7 @@ class AppWindow(QMainWindow):
 
 
     def action_save_json(self) -> None:
+        self.state.flush_pending_edits()
         path = self.state.current_path
         if not path:
             path, _ = QFileDialog.getSaveFileName(self, "Enregistrer JSON", "social_posts.json", "JSON (*.json)")
@@ -289,6 +293,7 @@ class AppWindow(QMainWindow):
             QMessageBox.critical(self, "Erreur", str(e))
 
     def action_export_js(self) -> None:
+        self.state.flush_pending_edits()
         path, _ = QFileDialog.getSaveFileName(self, "Exporter JS", "NAS_SocialData_MZ.js", "JavaScript (*.js)")
         if not path:
             return
@@ -302,11 +307,14 @@ class AppWindow(QMainWindow):
             print(tb)  # console
             QMessageBox.critical(self, "Export JS - erreur", tb)
 
-    def _update_window_title(self, is_dirty: bool) -> None:
+    def _update_window_title(self, _is_dirty: bool) -> None:
+        # Livraison différée : on lit l'état courant plutôt que la valeur émise
         name = "Sans nom"
         if self.state.current_path:
             name = Path(self.state.current_path).name
 
-        star = " *" if is_dirty else ""
-        self.setWindowTitle(f"{self._base_title} — {name}{star}")
+        star = " *" if self.state.is_dirty else ""
+        title = f"{self._base_title} — {name}{star}"
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
 
@@ -1,12 +1,18 @@
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 from qt_material import apply_stylesheet
 
 from app_window import AppWindow
 from theme_manager import ThemeManager
+from ui_helpers import AppSettings
 
 
 def main() -> None:
     app = QApplication([])
+    app.aboutToQuit.connect(AppSettings.sync)
+
+    # Cache pixmaps partagé (previews d'images) : 64 Mo au lieu des 10 Mo par défaut
+    QPixmapCache.setCacheLimit(64 * 1024)
 
     # Theme manager central (dark/light + couleur)
     theme = ThemeManager()
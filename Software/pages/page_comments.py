@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 
-from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtCore import QSignalBlocker, QStringListModel
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QTabWidget,
     QLabel, QComboBox, QMessageBox, QInputDialog, QPushButton
@@ -24,6 +24,10 @@ class PageComments(QWidget):
         self.state = state
         self._building_ui = False
 
+        # Dernières listes poussées dans les combos : pas de reset du modèle si rien n'a bougé
+        self._last_pools: list[str] | None = None
+        self._last_blocks: list[str] | None = None
+
         self._build_ui()
 
         self.state.dataChanged.connect(self.reload_from_state)
@@ -42,34 +46,40 @@ class PageComments(QWidget):
 
     def _set_dirty(self) -> None:
         self.state.mark_dirty()
-        self.state.dataChanged.emit()
+        self.state.notify_changed()
 
     def goto_set(self, set_id: str) -> None:
+        self.tabs.setCurrentWidget(self.tab_sets)
         with self._ui_guard():
-            self._refresh_sets(preserve_selection=False)
-            found = self.panel_sets.list.findItems(set_id, Qt.MatchExactly)
-            if found:
-                self.panel_sets.list.setCurrentItem(found[0])
-                self.panel_sets.list.scrollToItem(found[0])
+            self._refresh_sets_list(preserve_selection=False)
+            self.panel_sets.select_text(set_id)
+            self._refresh_set_details()
 
     def goto_block(self, block_id: str) -> None:
-        # Assure-toi que la liste des blocks est rafraîchie selon ton set courant.
+        self.tabs.setCurrentWidget(self.tab_blocks)
         with self._ui_guard():
-            self._refresh_blocks()
-            found = self.panel_blocks.list.findItems(block_id, Qt.MatchExactly)
-            if found:
-                self.panel_blocks.list.setCurrentItem(found[0])
-                self.panel_blocks.list.scrollToItem(found[0])
+            self._refresh_blocks_list(preserve_selection=False)
+            self.panel_blocks.select_text(block_id)
+            self._refresh_block_details()
 
 
     def _get_usernames(self) -> dict:
-        return self.state.data.setdefault("usernames", {})
+        d = self.state.data.get("usernames")
+        if d is None:
+            d = self.state.data["usernames"] = {}
+        return d
 
     def _get_blocks(self) -> dict:
-        return self.state.data.setdefault("commentBlocks", {})
+        d = self.state.data.get("commentBlocks")
+        if d is None:
+            d = self.state.data["commentBlocks"] = {}
+        return d
 
     def _get_sets(self) -> dict:
-        return self.state.data.setdefault("commentSets", {})
+        d = self.state.data.get("commentSets")
+        if d is None:
+            d = self.state.data["commentSets"] = {}
+        return d
 
     def _current_block_id(self) -> str | None:
         return self.panel_blocks.current_text()
@@ -130,6 +140,9 @@ class PageComments(QWidget):
         pool_row = QHBoxLayout()
         pool_row.addWidget(QLabel("Username pool:"))
         self.combo_pool = QComboBox()
+        # Repeuplé d'un bloc via setStringList (un seul reset du modèle)
+        self._pool_model = QStringListModel(self)
+        self.combo_pool.setModel(self._pool_model)
         self.combo_pool.currentIndexChanged.connect(self._on_pool_changed)
         pool_row.addWidget(self.combo_pool, 1)
 
@@ -185,6 +198,8 @@ class PageComments(QWidget):
         # Ligne Combo + Add
         add_row = QHBoxLayout()
         self.combo_blocks_in_set = QComboBox()
+        self._blocks_model = QStringListModel(self)
+        self.combo_blocks_in_set.setModel(self._blocks_model)
         self.btn_add_block_to_set = QPushButton("Add")
         self.btn_add_block_to_set.clicked.connect(self._add_block_to_set_from_combo)
 
@@ -233,12 +248,14 @@ class PageComments(QWidget):
     # Reload / refresh
     # =========================================================
     def _refresh_blocks_combo_for_sets(self) -> None:
-        blocks = sorted(self._get_blocks().keys())
+        blocks = sorted(self._get_blocks())
+        if blocks == self._last_blocks:
+            return
+        self._last_blocks = blocks
         old = self.combo_blocks_in_set.currentText()
 
         with QSignalBlocker(self.combo_blocks_in_set):
-            self.combo_blocks_in_set.clear()
-            self.combo_blocks_in_set.addItems(blocks)
+            self._blocks_model.setStringList(blocks)
             if old in blocks:
                 self.combo_blocks_in_set.setCurrentText(old)
 
@@ -257,12 +274,14 @@ class PageComments(QWidget):
             self._refresh_set_details()
 
     def _refresh_pool_combo(self) -> None:
-        pools = sorted(self._get_usernames().keys())
+        pools = sorted(self._get_usernames())
+        if pools == self._last_pools:
+            return
+        self._last_pools = pools
         old = self.combo_pool.currentText()
 
         with QSignalBlocker(self.combo_pool):
-            self.combo_pool.clear()
-            self.combo_pool.addItems(pools)
+            self._pool_model.setStringList(pools)
             if old in pools:
                 self.combo_pool.setCurrentText(old)
 
@@ -368,7 +387,7 @@ class PageComments(QWidget):
             return False
 
         # Nouveau block id unique
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in blocks)
+        new_id = ListPanel.make_unique_name(base_id, existing=blocks)
 
         # Copie profonde
         new_data = copy.deepcopy(data)
@@ -385,10 +404,7 @@ class PageComments(QWidget):
         # Refresh UI + sélection du nouveau block
         with self._ui_guard():
             self._refresh_blocks_list(preserve_selection=False)
-            found = self.panel_blocks.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.panel_blocks.list.setCurrentItem(found[0])
-                self.panel_blocks.list.scrollToItem(found[0])
+            self.panel_blocks.select_text(new_id)
             self._refresh_block_details()
 
             # Optionnel : si tu veux que la combo "Blocks in set" soit à jour tout de suite
@@ -418,9 +434,7 @@ class PageComments(QWidget):
 
         with self._ui_guard():
             self._refresh_blocks_list(preserve_selection=False)
-            found = self.panel_blocks.list.findItems(name, Qt.MatchExactly)
-            if found:
-                self.panel_blocks.list.setCurrentItem(found[0])
+            self.panel_blocks.select_text(name, scroll=False)
             self._refresh_block_details()
 
     def _add_block_to_set_from_combo(self) -> None:
@@ -502,9 +516,7 @@ class PageComments(QWidget):
             self._refresh_blocks_list(preserve_selection=False)
             self._refresh_sets_list(preserve_selection=True)
 
-            found = self.panel_blocks.list.findItems(new, Qt.MatchExactly)
-            if found:
-                self.panel_blocks.list.setCurrentItem(found[0])
+            self.panel_blocks.select_text(new, scroll=False)
 
             self._refresh_block_details()
             self._refresh_set_details()
@@ -565,17 +577,14 @@ class PageComments(QWidget):
         if not isinstance(data, list):
             return False
 
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in sets)
+        new_id = ListPanel.make_unique_name(base_id, existing=sets)
         sets[new_id] = list(data)
 
         self._set_dirty()
 
         with self._ui_guard():
             self._refresh_sets_list(preserve_selection=False)
-            found = self.panel_sets.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.panel_sets.list.setCurrentItem(found[0])
-                self.panel_sets.list.scrollToItem(found[0])
+            self.panel_sets.select_text(new_id)
             self._refresh_set_details()
 
         return True
@@ -664,9 +673,7 @@ class PageComments(QWidget):
 
         with self._ui_guard():
             self._refresh_sets_list(preserve_selection=False)
-            found = self.panel_sets.list.findItems(name, Qt.MatchExactly)
-            if found:
-                self.panel_sets.list.setCurrentItem(found[0])
+            self.panel_sets.select_text(name, scroll=False)
             self._refresh_set_details()
 
     # Software/pages/page_comments.py
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 
-from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer, Slot
 from PySide6.QtGui import QIntValidator
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QAbstractItemView,
@@ -45,6 +45,14 @@ class PageEmoji(QWidget):
         self.state = state
         self._building_ui = False
 
+        # Éditions de valeurs en rafale (Tab entre les 8 champs) :
+        # un seul dataChanged, 150 ms après la dernière.
+        self._values_changed_timer = QTimer(self)
+        self._values_changed_timer.setSingleShot(True)
+        self._values_changed_timer.setInterval(150)
+        self._values_changed_timer.timeout.connect(self._emit_values_changed)
+        self._emitting_values_changed = False
+
         self._build_ui()
 
         self.state.dataChanged.connect(self.reload_from_state)
@@ -63,7 +71,10 @@ class PageEmoji(QWidget):
             self._building_ui = False
 
     def _get_presets(self) -> dict:
-        return self.state.data.setdefault("emojiPresets", {})
+        d = self.state.data.get("emojiPresets")
+        if d is None:
+            d = self.state.data["emojiPresets"] = {}
+        return d
 
     def _current_preset_id(self) -> str | None:
         return self.panel_presets.current_text()
@@ -78,10 +89,11 @@ class PageEmoji(QWidget):
         }
 
     @staticmethod
-    def _to_int(text: str, default: int = 0) -> int:
+    def _to_int(value: object, default: int = 0) -> int:
+        # int() tolère déjà les espaces ; "" (champ vidé) ou valeur invalide => default
         try:
-            return int(text) if text.strip() else default
-        except ValueError:
+            return int(value)
+        except (TypeError, ValueError):
             return default
 
     @staticmethod
@@ -91,15 +103,22 @@ class PageEmoji(QWidget):
 
     def _set_dirty(self) -> None:
         self.state.mark_dirty()
-        self.state.dataChanged.emit()
+        self.state.notify_changed()
+
+    def _emit_values_changed(self) -> None:
+        # Notre éditeur reflète déjà ces valeurs : on ignore notre propre diffusion
+        # (sinon un champ en cours de saisie serait écrasé par le refresh).
+        self._emitting_values_changed = True
+        try:
+            self.state.dataChanged.emit()
+        finally:
+            self._emitting_values_changed = False
 
     def goto_preset(self, preset_id: str) -> None:
         with self._ui_guard():
-            self._refresh_presets(preserve_selection=False)
-            found = self.panel_presets.list.findItems(preset_id, Qt.MatchExactly)
-            if found:
-                self.panel_presets.list.setCurrentItem(found[0])
-                self.panel_presets.list.scrollToItem(found[0])
+            self._refresh_list(preserve_selection=False)
+            self.panel_presets.select_text(preset_id)
+            self._refresh_editor()
 
 
     # =========================================================
@@ -149,8 +168,9 @@ class PageEmoji(QWidget):
         # Validation ints >= 0
         self._int_validator = QIntValidator(0, 999999, self)
 
-        # Champs: (key, subkey) -> QLineEdit
+        # Champs: (key, subkey) -> QLineEdit ; et champ -> key pour le slot partagé
         self.inputs: dict[tuple[str, str], QLineEdit] = {}
+        self._le_to_key: dict[QLineEdit, str] = {}
 
         for key in self.KEYS:
             label = self.EMOJI_LABELS.get(key, key)
@@ -162,11 +182,13 @@ class PageEmoji(QWidget):
             le_min.setValidator(self._int_validator)
             le_max.setValidator(self._int_validator)
 
-            le_min.editingFinished.connect(lambda k=key: self._on_value_changed(k))
-            le_max.editingFinished.connect(lambda k=key: self._on_value_changed(k))
+            le_min.editingFinished.connect(self._on_any_value_edited)
+            le_max.editingFinished.connect(self._on_any_value_edited)
 
             self.inputs[(key, "min")] = le_min
             self.inputs[(key, "max")] = le_max
+            self._le_to_key[le_min] = key
+            self._le_to_key[le_max] = key
 
             f.addRow("Min", le_min)
             f.addRow("Max", le_max)
@@ -186,6 +208,8 @@ class PageEmoji(QWidget):
     # Reload / refresh
     # =========================================================
     def reload_from_state(self) -> None:
+        if self._emitting_values_changed:
+            return
         with self._ui_guard():
             self._get_presets()
             self._refresh_list(preserve_selection=True)
@@ -198,7 +222,7 @@ class PageEmoji(QWidget):
         ordered_ids = [
             pid for pid, _ in sorted(
                 presets.items(),
-                key=lambda kv: self._to_int(str(kv[1].get("order", 0)), 0),
+                key=lambda kv: self._to_int(kv[1].get("order", 0), 0),
             )
         ]
 
@@ -225,8 +249,8 @@ class PageEmoji(QWidget):
         data = presets[pid]
         for key in self.KEYS:
             key_data = data.get(key, {})
-            vmin = self._to_int(str(key_data.get("min", 0)), 0)
-            vmax = self._to_int(str(key_data.get("max", 0)), 0)
+            vmin = self._to_int(key_data.get("min", 0), 0)
+            vmax = self._to_int(key_data.get("max", 0), 0)
             self.inputs[(key, "min")].setText(str(vmin))
             self.inputs[(key, "max")].setText(str(vmax))
 
@@ -283,7 +307,7 @@ class PageEmoji(QWidget):
             return False
 
         # Nom unique
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in presets)
+        new_id = ListPanel.make_unique_name(base_id, existing=presets)
 
         # Copie + order en fin (append)
         new_data = copy.deepcopy(data)
@@ -299,10 +323,7 @@ class PageEmoji(QWidget):
         # Refresh UI + sélection
         with self._ui_guard():
             self._refresh_list(preserve_selection=False)
-            found = self.panel_presets.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.panel_presets.list.setCurrentItem(found[0])
-                self.panel_presets.list.scrollToItem(found[0])
+            self.panel_presets.select_text(new_id)
             self._refresh_editor()
 
         return True
@@ -331,9 +352,7 @@ class PageEmoji(QWidget):
 
         with self._ui_guard():
             self._refresh_list(preserve_selection=False)
-            found = self.panel_presets.list.findItems(name, Qt.MatchExactly)
-            if found:
-                self.panel_presets.list.setCurrentItem(found[0])
+            self.panel_presets.select_text(name, scroll=False)
             self._refresh_editor()
 
     # Software/pages/page_emoji.py
@@ -391,6 +410,12 @@ class PageEmoji(QWidget):
     # =========================================================
     # Values editing
     # =========================================================
+    @Slot()
+    def _on_any_value_edited(self) -> None:
+        key = self._le_to_key.get(self.sender())
+        if key:
+            self._on_value_changed(key)
+
     def _on_value_changed(self, key: str) -> None:
         if self._building_ui:
             return
@@ -419,4 +444,5 @@ class PageEmoji(QWidget):
 
         key_obj["min"] = vmin
         key_obj["max"] = vmax
-        self._set_dirty()
+        self.state.mark_dirty()
+        self._values_changed_timer.start()
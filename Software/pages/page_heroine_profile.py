@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtCore import Qt, QModelIndex, QSignalBlocker, Slot
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QMessageBox, QInputDialog, QAbstractItemView
 )
@@ -11,8 +11,7 @@ from PySide6.QtWidgets import (
 from state import AppState
 from social_editor_shell import SocialEditorShell, ShellTexts
 from ui_helpers import ListPanel
-from pages.social_profile_base import SocialProfilePageBase
-import copy
+from pages.social_profile_base import DEFAULT_EMOJI, SocialProfilePageBase
 
 
 class PageHeroineProfile(SocialProfilePageBase):
@@ -39,6 +38,9 @@ class PageHeroineProfile(SocialProfilePageBase):
     def __init__(self, state: AppState):
         super().__init__(state)
 
+        # Derniers posts (ordonnés) affichés par reload_from_state
+        self._last_lists_snapshot: tuple[str, ...] | None = None
+
         # Shell
         self.shell = SocialEditorShell(
             profile_editor=self._profile_editor,
@@ -74,12 +76,13 @@ class PageHeroineProfile(SocialProfilePageBase):
         )
 
         # --- Drag & drop interne pour réordonner les posts
-        self.shell.panel_posts.list.setDragEnabled(True)
-        self.shell.panel_posts.list.setAcceptDrops(True)
-        self.shell.panel_posts.list.setDropIndicatorShown(True)
-        self.shell.panel_posts.list.setDefaultDropAction(Qt.MoveAction)
-        self.shell.panel_posts.list.setDragDropMode(QAbstractItemView.InternalMove)
-        self.shell.panel_posts.list.model().rowsMoved.connect(self._on_posts_reordered)
+        post_list = self.shell.panel_posts.list
+        post_list.setDragEnabled(True)
+        post_list.setAcceptDrops(True)
+        post_list.setDropIndicatorShown(True)
+        post_list.setDefaultDropAction(Qt.MoveAction)
+        post_list.setDragDropMode(QAbstractItemView.InternalMove)
+        post_list.model().rowsMoved.connect(self._on_posts_reordered)
 
         # Empêche saisie profile panel
         self.shell.panel_profiles.input.setEnabled(False)
@@ -108,6 +111,7 @@ class PageHeroineProfile(SocialProfilePageBase):
         return "Picture/Naelith"
 
     def _pack_post(self) -> object | None:
+        self._flush_pending_edits()
         post_id = self.shell.current_post_id()
         if not post_id:
             return None
@@ -119,34 +123,30 @@ class PageHeroineProfile(SocialProfilePageBase):
         return {
             "kind": "heroine_post",
             "id": post_id,
-            "data": copy.deepcopy(posts[post_id]),
+            "data": posts[post_id],  # sérialisé tout de suite par ListPanel
         }
 
 
     def _paste_post(self, payload: object) -> bool:
         if not isinstance(payload, dict) or payload.get("kind") != "heroine_post":
             return False
-
-        posts = self._heroine_posts()
-
-        base_id = str(payload.get("id") or "Post").strip() or "Post"
         data = payload.get("data")
         if not isinstance(data, dict):
             return False
 
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in posts)  # <= il faut importer ListPanel
-        new_data = copy.deepcopy(data)
+        # Rejets "gratuits" faits : on peut maintenant résoudre l'id puis copier
+        posts = self._heroine_posts()
+        base_id = str(payload.get("id") or "Post").strip() or "Post"
+        new_id = ListPanel.make_unique_name(base_id, existing=posts)  # <= il faut importer ListPanel
+        new_data = data  # fraîchement désérialisé depuis le presse-papier => pas de copie
         new_data["order"] = self.shell.panel_posts.list.count()
         posts[new_id] = new_data
 
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=False)
-            found = self.shell.panel_posts.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
-                self.shell.panel_posts.list.scrollToItem(found[0])
+            self._reload_lists(preserve_selection=False)
+            self.shell.panel_posts.select_text(new_id)
 
         return True
 
@@ -162,17 +162,10 @@ class PageHeroineProfile(SocialProfilePageBase):
 
     def _get_post(self, post_id: str) -> dict[str, Any]:
         posts = self._heroine_posts()
-        post = posts.setdefault(post_id, {})
-        post.setdefault("pictureName", "")
-        post.setdefault("description", "")
-        post.setdefault("timeslot", "all")
-        post.setdefault("conditionJS", "")
-        post.setdefault("effectJs", "")
-        post.setdefault("emojiPreset", "")      # "" => custom
-        post.setdefault("emojiOverride", self._default_emoji())
-        post.setdefault("commentsSet", "")
-        post.setdefault("lewdCondition", {"min": 0, "max": 999999})
-        return post
+        post = posts.get(post_id)
+        if post is None:
+            post = posts[post_id] = {}
+        return self._fill_post_defaults(post)
 
     @staticmethod
     def _to_int(text: str, default: int = 0) -> int:
@@ -206,19 +199,31 @@ class PageHeroineProfile(SocialProfilePageBase):
 
     def _rebuild_post_orders(self) -> None:
         posts = self._heroine_posts()
-        for i in range(self.shell.panel_posts.list.count()):
-            item = self.shell.panel_posts.list.item(i)
+        lst = self.shell.panel_posts.list
+        for i in range(lst.count()):
+            item = lst.item(i)
             if not item:
                 continue
             post_id = item.text()
             if post_id in posts:
                 posts[post_id]["order"] = i
 
+    def _store_lists_snapshot(self) -> None:
+        """Les posts affichés reflètent les données (après reload, rename ou drag) : on le note."""
+        self._last_lists_snapshot = tuple(self._list_posts(self.PROFILE_ID))
+
+    def _reload_lists(self, *, preserve_selection: bool) -> None:
+        """Seul point d'appel de shell.reload_lists : le snapshot ne peut pas rester périmé."""
+        self.shell.reload_lists(preserve_selection=preserve_selection)
+        self._store_lists_snapshot()
+
+    @Slot(QModelIndex, int, int, QModelIndex, int)
     def _on_posts_reordered(self, *_args) -> None:
-        if self._building_ui:
+        if self._ui_guard_depth:
             return
         self._rebuild_post_orders()
         self.state.mark_dirty()
+        self._store_lists_snapshot()  # ordre glissé = nouvel ordre des données
 
     def _on_profile_selected(self, _profile_id: str | None) -> None:
         # Quand on clique le profil => refresh profil
@@ -231,31 +236,32 @@ class PageHeroineProfile(SocialProfilePageBase):
     # =========================================================
     # Build editors
     # =========================================================
-    def goto_post(self, profile_id: str, post_key: str, field: str = "") -> None:
-        with self._ui_guard():
-            self._refresh_profiles(preserve_selection=False)
-            p_items = self.panel_profiles.list.findItems(profile_id, Qt.MatchExactly)
-            if p_items:
-                self.panel_profiles.list.setCurrentItem(p_items[0])
-                self.panel_profiles.list.scrollToItem(p_items[0])
-
-            self._refresh_posts()
-            post_items = self.panel_posts.list.findItems(post_key, Qt.MatchExactly)
-            if post_items:
-                self.panel_posts.list.setCurrentItem(post_items[0])
-                self.panel_posts.list.scrollToItem(post_items[0])
+    def goto_post(self, post_key: str, field: str = "") -> None:
+        """
+        Navigation (ex: depuis la page Validation) : profil unique, on sélectionne
+        directement le post par index ; rechargement seulement s'il est absent.
+        """
+        panel_posts = self.shell.panel_posts
+        if panel_posts.index_of(post_key) < 0:
+            self._reload_lists(preserve_selection=True)
+        if not panel_posts.select_text(post_key):
+            return
+        self.shell.show_post_editor()
 
-            # Optionnel : si tu as un widget spécifique pour emojiPreset/commentsSet, focus dessus.
-            # if field == "emojiPreset": self.combo_emojiPreset.setFocus()
-            # if field == "commentsSet": self.combo_commentsSet.setFocus()
+        # Optionnel : si tu as un widget spécifique pour emojiPreset/commentsSet, focus dessus.
+        # if field == "emojiPreset": self.combo_emojiPreset.setFocus()
+        # if field == "commentsSet": self.combo_commentsSet.setFocus()
 
 
+    @Slot()
     def reload_from_state(self) -> None:
         with self._ui_guard():
             self._ensure_heroine_root()
 
-            # Reload lists via shell
-            self.shell.reload_lists(preserve_selection=True)
+            # Reload lists via shell, seulement si les posts affichés ont changé
+            snapshot = tuple(self._list_posts(self.PROFILE_ID))
+            if snapshot != self._last_lists_snapshot:
+                self._reload_lists(preserve_selection=True)
 
             # Always refresh dropdowns (presets/sets)
             self._refresh_emoji_preset_dropdown()
@@ -268,38 +274,49 @@ class PageHeroineProfile(SocialProfilePageBase):
             self._refresh_post_editor(post_id)
 
     def _refresh_profile_editor(self) -> None:
+        self._flush_pending_edits()
         root = self._ensure_heroine_root()
+        self._active_profile = root
         with self._ui_guard():
-            self.le_display_name.setText(root.get("defaultDisplayName", "") or "")
+            self._set_text(self.le_display_name, root.get("defaultDisplayName", "") or "")
             self._set_image_preview(self.lbl_profile_img, root.get("defaultProfileImage", "") or "")
 
     def _refresh_post_editor(self, post_id: str | None) -> None:
+        self._flush_pending_edits()  # la saisie en attente va au post qu'on quitte
         enabled = bool(post_id)
+        if self._defer_post_editor(enabled):
+            return
+        self._ensure_post_editor()
         self.grp_post.setEnabled(enabled)
 
         if not enabled:
-            with self._ui_guard():
-                self.lbl_post_id.setText("-")
+            self._active_post = None
+            with self._ui_guard(), self._block_post_editor_signals():
+                self._set_text(self.lbl_post_id, "-")
                 self._set_image_preview(self.lbl_post_img, "")
                 self.te_description.setPlainText("")
-                self.cb_timeslot.setCurrentText("all")
-                self.le_condition.setText("")
-                self.le_effect.setText("")
+                self._select_timeslot("all")
+                self._set_text(self.le_condition, "")
+                self._set_text(self.le_effect, "")
+                self._show_lewd_condition(None)
                 self._select_emoji_preset("")
-                self._set_emoji_values(self._default_emoji())
+                self._set_emoji_values(DEFAULT_EMOJI)
                 self._select_comment_set("")
             return
 
         post = self._get_post(post_id)
+        self._active_post = post
 
-        with self._ui_guard():
-            self.lbl_post_id.setText(post_id)
+        self._ensure_emoji_grid_built()
+        with self._ui_guard(), self._block_post_editor_signals():
+            self._set_text(self.lbl_post_id, post_id)
             self._set_image_preview(self.lbl_post_img, post.get("pictureName", "") or "")
 
             self.te_description.setPlainText(post.get("description", "") or "")
-            self.cb_timeslot.setCurrentText(post.get("timeslot", "all") or "all")
-            self.le_condition.setText(post.get("conditionJS", "") or "")
-            self.le_effect.setText(post.get("effectJs", "") or "")
+            self._select_timeslot(post.get("timeslot", "all") or "all")
+            self._set_text(self.le_condition, post.get("conditionJS", "") or "")
+            self._set_text(self.le_effect, post.get("effectJs", "") or "")
+            self._show_lewd_condition(post)
 
             preset = (post.get("emojiPreset") or "").strip()
             if preset and preset in self._emoji_presets():
@@ -307,7 +324,7 @@ class PageHeroineProfile(SocialProfilePageBase):
                 self._set_emoji_values(self._emoji_presets()[preset])
             else:
                 self._select_emoji_preset("")
-                self._set_emoji_values(post.get("emojiOverride") or self._default_emoji())
+                self._set_emoji_values(post.get("emojiOverride") or DEFAULT_EMOJI)
 
             self._select_comment_set(post.get("commentsSet", "") or "")
 
@@ -321,27 +338,14 @@ class PageHeroineProfile(SocialProfilePageBase):
             QMessageBox.warning(self, "Erreur", f"Le post '{post_id}' existe déjà.")
             return
 
-        posts[post_id] = {
-            "pictureName": "",
-            "description": "",
-            "timeslot": "all",
-            "conditionJS": "",
-            "effectJs": "",
-            "emojiPreset": "",
-            "emojiOverride": self._default_emoji(),
-            "commentsSet": "",
-            "lewdCondition": {"min": 0, "max": 999999},
-            "order": self.shell.panel_posts.list.count(),
-        }
+        posts[post_id] = self._fill_post_defaults({"order": self.shell.panel_posts.list.count()})
 
         self.state.mark_dirty()
         self.shell.panel_posts.clear_input()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=False)
-            found = self.shell.panel_posts.list.findItems(post_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
+            self._reload_lists(preserve_selection=False)
+            self.shell.panel_posts.select_text(post_id, scroll=False)
             # Shell va afficher l'éditeur post via sélectionChanged
 
     def _post_rename_from_typed(self, typed: str) -> None:
@@ -350,12 +354,13 @@ class PageHeroineProfile(SocialProfilePageBase):
             return
 
         # UX: si champ vide -> pré-remplir + focus
-        if not typed.strip():
+        new = typed.strip()
+        if not new:
             self.shell.panel_posts.input.setText(old)
             self.shell.panel_posts.focus_input(select_all=True)
             return
 
-        self._post_rename(old, typed.strip())
+        self._post_rename(old, new)
 
     def _post_rename(self, old: str, new: str) -> None:
         posts = self._heroine_posts()
@@ -366,15 +371,17 @@ class PageHeroineProfile(SocialProfilePageBase):
             QMessageBox.warning(self, "Erreur", f"Le post '{new}' existe déjà.")
             return
 
-        posts[new] = posts.pop(old)
+        self.state.rename_key(posts, old, new)
         self.state.mark_dirty()
         self.shell.panel_posts.clear_input()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=False)
-            found = self.shell.panel_posts.list.findItems(new, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
+            # Une seule ligne change : on renomme l'item au lieu de reconstruire la liste
+            if not self.shell.panel_posts.rename_item(old, new):
+                self._reload_lists(preserve_selection=False)
+                self.shell.panel_posts.select_text(new, scroll=False)
+            else:
+                self._store_lists_snapshot()
 
     def _post_delete(self) -> None:
         post_id = self.shell.current_post_id()
@@ -383,10 +390,11 @@ class PageHeroineProfile(SocialProfilePageBase):
 
         # ListPanel fait déjà la confirmation (confirm_delete=True)
         self._heroine_posts().pop(post_id, None)
+        self._active_post = None  # re-posé par _refresh_post_editor ci-dessous
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=False)
+            self._reload_lists(preserve_selection=False)
             # Si plus de sélection -> on revient sur profil
             if not self.shell.current_post_id():
                 self.shell.show_profile_editor()
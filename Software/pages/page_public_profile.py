@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtCore import Qt, QModelIndex, QSignalBlocker, Slot
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QMessageBox, QAbstractItemView
 )
@@ -11,8 +11,7 @@ from PySide6.QtWidgets import (
 from state import AppState
 from social_editor_shell import SocialEditorShell, ShellTexts
 from ui_helpers import ListPanel
-from pages.social_profile_base import SocialProfilePageBase
-import copy
+from pages.social_profile_base import DEFAULT_EMOJI, SocialProfilePageBase
 
 PUBLIC_PROFILES_KEY = "profiles"
 
@@ -43,6 +42,14 @@ class PagePublicProfile(SocialProfilePageBase):
     def __init__(self, state: AppState):
         super().__init__(state)
 
+        # Cache de _list_profiles (ids triés par "order"), invalidé à chaque mutation
+        self._profiles_order_cache: list[str] | None = None
+        # True quand chaque profil a "order" == sa row (après une réécriture complète) :
+        # un drag & drop peut alors ne réécrire que la fenêtre déplacée.
+        self._profile_orders_contiguous = False
+        # Dernier _lists_snapshot() affiché par reload_from_state
+        self._last_lists_snapshot: tuple | None = None
+
         # Shell (2 colonnes visibles)
         self.shell = SocialEditorShell(
             profile_editor=self._profile_editor,
@@ -59,22 +66,24 @@ class PagePublicProfile(SocialProfilePageBase):
         )
 
         # --- Drag & drop interne pour réordonner les profils (uniquement software)
-        self.shell.panel_profiles.list.setDragEnabled(True)
-        self.shell.panel_profiles.list.setAcceptDrops(True)
-        self.shell.panel_profiles.list.setDropIndicatorShown(True)
-        self.shell.panel_profiles.list.setDefaultDropAction(Qt.MoveAction)
-        self.shell.panel_profiles.list.setDragDropMode(QAbstractItemView.InternalMove)
+        prof_list = self.shell.panel_profiles.list
+        prof_list.setDragEnabled(True)
+        prof_list.setAcceptDrops(True)
+        prof_list.setDropIndicatorShown(True)
+        prof_list.setDefaultDropAction(Qt.MoveAction)
+        prof_list.setDragDropMode(QAbstractItemView.InternalMove)
 
         # Capte le ré-ordonnancement
-        self.shell.panel_profiles.list.model().rowsMoved.connect(self._on_profiles_reordered)
+        prof_list.model().rowsMoved.connect(self._on_profiles_reordered)
 
         # --- Drag & drop interne pour réordonner les posts
-        self.shell.panel_posts.list.setDragEnabled(True)
-        self.shell.panel_posts.list.setAcceptDrops(True)
-        self.shell.panel_posts.list.setDropIndicatorShown(True)
-        self.shell.panel_posts.list.setDefaultDropAction(Qt.MoveAction)
-        self.shell.panel_posts.list.setDragDropMode(QAbstractItemView.InternalMove)
-        self.shell.panel_posts.list.model().rowsMoved.connect(self._on_posts_reordered)
+        post_list = self.shell.panel_posts.list
+        post_list.setDragEnabled(True)
+        post_list.setAcceptDrops(True)
+        post_list.setDropIndicatorShown(True)
+        post_list.setDefaultDropAction(Qt.MoveAction)
+        post_list.setDragDropMode(QAbstractItemView.InternalMove)
+        post_list.model().rowsMoved.connect(self._on_posts_reordered)
             
         layout = QVBoxLayout(self)
         layout.addWidget(self.shell, 1)
@@ -127,6 +136,7 @@ class PagePublicProfile(SocialProfilePageBase):
 
 
     def _pack_profile(self) -> object | None:
+        self._flush_pending_edits()
         profile_id = self.shell.current_profile_id()
         if not profile_id:
             return None
@@ -138,42 +148,42 @@ class PagePublicProfile(SocialProfilePageBase):
         return {
             "kind": "public_profile",
             "id": profile_id,
-            "data": copy.deepcopy(profiles[profile_id]),
+            "data": profiles[profile_id],  # sérialisé tout de suite par ListPanel
         }
 
 
     def _paste_profile(self, payload: object) -> bool:
         if not isinstance(payload, dict) or payload.get("kind") != "public_profile":
             return False
-
-        profiles = self._public_profiles()
-
-        base_id = str(payload.get("id") or "Profile").strip() or "Profile"
         data = payload.get("data")
         if not isinstance(data, dict):
             return False
 
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in profiles)
-        new_data = copy.deepcopy(data)
+        # Rejets "gratuits" faits : on peut maintenant résoudre l'id puis copier
+        profiles = self._public_profiles()
+        base_id = str(payload.get("id") or "Profile").strip() or "Profile"
+        new_id = ListPanel.make_unique_name(base_id, existing=profiles)
+        new_data = data  # fraîchement désérialisé depuis le presse-papier => pas de copie
+        if new_data.get("posts") is None:
+            new_data["posts"] = {}  # même forme que _normalize_data (state)
 
         # order: append en fin
         self._rebuild_profile_orders()
         new_data["order"] = self.shell.panel_profiles.list.count()
 
         profiles[new_id] = new_data
+        self._profiles_order_cache = None
 
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_profiles.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_profiles.list.setCurrentItem(found[0])
-                self.shell.panel_profiles.list.scrollToItem(found[0])
+            self._reload_lists()
+            self.shell.panel_profiles.select_text(new_id)
 
         return True
 
     def _pack_post(self) -> object | None:
+        self._flush_pending_edits()
         profile_id = self.shell.current_profile_id()
         post_id = self.shell.current_post_id()
         if not profile_id or not post_id:
@@ -186,44 +196,43 @@ class PagePublicProfile(SocialProfilePageBase):
         return {
             "kind": "public_post",
             "id": post_id,
-            "data": copy.deepcopy(posts[post_id]),
+            "data": posts[post_id],  # sérialisé tout de suite par ListPanel
         }
 
 
     def _paste_post(self, payload: object) -> bool:
         if not isinstance(payload, dict) or payload.get("kind") != "public_post":
             return False
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            return False
 
         profile_id = self.shell.current_profile_id()
         if not profile_id:
             return False
 
+        # Rejets "gratuits" faits : on peut maintenant résoudre l'id puis copier
         posts = self._profile_posts(profile_id)
-
         base_id = str(payload.get("id") or "Post").strip() or "Post"
-        data = payload.get("data")
-        if not isinstance(data, dict):
-            return False
-
-        new_id = ListPanel.make_unique_name(base_id, exists=lambda s: s in posts)
-        new_data = copy.deepcopy(data)
+        new_id = ListPanel.make_unique_name(base_id, existing=posts)
+        new_data = data  # fraîchement désérialisé depuis le presse-papier => pas de copie
         new_data["order"] = self.shell.panel_posts.list.count()
         posts[new_id] = new_data
 
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_posts.list.findItems(new_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
-                self.shell.panel_posts.list.scrollToItem(found[0])
+            self._reload_lists()
+            self.shell.panel_posts.select_text(new_id)
 
         return True
 
 
     def _ensure_public_root(self) -> dict[str, Any]:
-        return self.state.data.setdefault(PUBLIC_PROFILES_KEY, {})
+        d = self.state.data.get(PUBLIC_PROFILES_KEY)
+        if d is None:
+            d = self.state.data[PUBLIC_PROFILES_KEY] = {}
+        return d
 
     def _public_profiles(self) -> dict[str, Any]:
         return self._ensure_public_root()
@@ -241,59 +250,88 @@ class PagePublicProfile(SocialProfilePageBase):
 
     def _get_post(self, profile_id: str, post_id: str) -> dict[str, Any]:
         posts = self._profile_posts(profile_id)
-        post = posts.setdefault(post_id, {})
-        post.setdefault("pictureName", "")
-        post.setdefault("description", "")
-        post.setdefault("timeslot", "all")
-        post.setdefault("conditionJS", "")
-        post.setdefault("effectJs", "")
-        post.setdefault("emojiPreset", "")      # "" => custom
-        post.setdefault("emojiOverride", self._default_emoji())
-        post.setdefault("commentsSet", "")
-        post.setdefault("lewdCondition", {"min": 0, "max": 999999})
-        return post
+        post = posts.get(post_id)
+        if post is None:
+            post = posts[post_id] = {}
+        return self._fill_post_defaults(post)
 
     def _to_int(self, text: str, default: int = 0) -> int:
         try:
             return int(text) if str(text).strip() else default
-        except ValueError:
+        except (TypeError, ValueError):
             return default
 
-    def _rebuild_profile_orders(self) -> None:
-        """Réécrit profiles[pid]['order'] selon l'ordre visible dans la liste."""
+    def _rebuild_profile_orders(self, first: int = 0, last: int | None = None) -> None:
+        """
+        Réécrit profiles[pid]['order'] selon l'ordre visible dans la liste.
+        first/last (inclus) restreignent la réécriture à une fenêtre de rows.
+        """
+        lst = self.shell.panel_profiles.list
         profiles = self._public_profiles()
-        for i in range(self.shell.panel_profiles.list.count()):
-            pid = self.shell.panel_profiles.list.item(i).text()
-            if pid in profiles:
-                profiles[pid]["order"] = i
-
-    def _on_profiles_reordered(self, *_args) -> None:
-        if self._building_ui:
+        item = lst.item
+        count = lst.count()
+        last = count - 1 if last is None else min(last, count - 1)
+        for i in range(max(first, 0), last + 1):
+            p = profiles.get(item(i).text())
+            if p is not None:
+                p["order"] = i
+        if first <= 0 and last == count - 1:
+            self._profile_orders_contiguous = True
+        self._profiles_order_cache = None
+
+    @Slot(QModelIndex, int, int, QModelIndex, int)
+    def _on_profiles_reordered(self, _parent=None, start: int = 0, end: int = -1,
+                               _destination=None, row: int = -1) -> None:
+        if self._ui_guard_depth:
             return
-        self._rebuild_profile_orders()
+        if start <= row <= end + 1:
+            return  # déposé sur place : rien n'a bougé
+
+        if self._profile_orders_contiguous and row >= 0:
+            # Seules les rows entre la source et la destination ont changé
+            self._rebuild_profile_orders(min(start, row), max(end, row - 1))
+        else:
+            self._rebuild_profile_orders()
         self.state.mark_dirty()
+        self._store_lists_snapshot()  # ordre glissé = nouvel ordre des données
 
+    @Slot(QModelIndex, int, int, QModelIndex, int)
     def _on_posts_reordered(self, *_args) -> None:
-        if self._building_ui:
+        if self._ui_guard_depth:
             return
         profile_id = self.shell.current_profile_id()
         if not profile_id:
             return
         self._rebuild_post_orders(profile_id)
         self.state.mark_dirty()
+        self._store_lists_snapshot()
 
     # =========================================================
     # Shell bindings
     # =========================================================
     def _list_profiles(self) -> list[str]:
+        if self._profiles_order_cache is not None:
+            return self._profiles_order_cache
+
+        # "order" est garanti int par _ensure_profile_orders => tri direct des clés
         profiles = self._public_profiles()
-        return [
-            pid for pid, _ in sorted(
-                profiles.items(),
-                key=lambda kv: self._to_int(kv[1].get("order", 0), 0),
-            )
-        ]
+        self._profiles_order_cache = sorted(profiles, key=lambda pid: profiles[pid].get("order", 0))
+        return self._profiles_order_cache
+
+
+    def _lists_snapshot(self) -> tuple:
+        """(profils ordonnés, profil courant, posts ordonnés) tels que reload_lists les afficherait."""
+        prof = self.shell.current_profile_id()
+        return tuple(self._list_profiles()), prof, tuple(self._list_posts(prof))
 
+    def _store_lists_snapshot(self) -> None:
+        """Les listes affichées reflètent les données (après reload, rename ou drag) : on le note."""
+        self._last_lists_snapshot = self._lists_snapshot()
+
+    def _reload_lists(self) -> None:
+        """Seul point d'appel de shell.reload_lists : le snapshot ne peut pas rester périmé."""
+        self.shell.reload_lists(preserve_selection=True)
+        self._store_lists_snapshot()
 
     def _list_posts(self, profile_id: str) -> list[str]:
         if not profile_id:
@@ -320,6 +358,13 @@ class PagePublicProfile(SocialProfilePageBase):
     # =========================================================
     def _ensure_profile_orders(self) -> None:
         profiles = self._public_profiles()
+
+        # Normalise une fois les "order" non entiers (JSON édité à la main, etc.)
+        for p in profiles.values():
+            order = p.get("order")
+            if order is not None and type(order) is not int:
+                p["order"] = self._to_int(order, 0)
+
         # Si aucun order, on initialise selon tri alpha actuel pour rester stable.
         missing = [pid for pid, p in profiles.items() if "order" not in p]
         if not missing:
@@ -339,20 +384,27 @@ class PagePublicProfile(SocialProfilePageBase):
 
     def _rebuild_post_orders(self, profile_id: str) -> None:
         posts = self._profile_posts(profile_id)
-        for i in range(self.shell.panel_posts.list.count()):
-            item = self.shell.panel_posts.list.item(i)
+        lst = self.shell.panel_posts.list
+        for i in range(lst.count()):
+            item = lst.item(i)
             if not item:
                 continue
             post_id = item.text()
             if post_id in posts:
                 posts[post_id]["order"] = i
 
+    @Slot()
     def reload_from_state(self) -> None:
+        # Les données ont pu changer de l'extérieur (chargement JSON, etc.)
+        self._profiles_order_cache = None
+        self._profile_orders_contiguous = False
         with self._ui_guard():
             self._ensure_public_root()
             self._ensure_profile_orders()
-            self.shell.reload_lists(preserve_selection=True)
-            ...
+            # Reconstruit les QListWidget seulement si profils/posts affichés ont changé
+            snapshot = self._lists_snapshot()
+            if snapshot != self._last_lists_snapshot:
+                self._reload_lists()
 
 
             self._refresh_emoji_preset_dropdown()
@@ -365,51 +417,63 @@ class PagePublicProfile(SocialProfilePageBase):
             self._refresh_post_editor(prof, post)
 
     def _refresh_profile_editor(self, profile_id: str | None) -> None:
+        self._flush_pending_edits()  # le nom en attente va au profil qu'on quitte
         enabled = bool(profile_id)
         # On disable l'éditeur profil si rien sélectionné
         self._profile_editor.setEnabled(enabled)
 
         if not enabled:
+            self._active_profile = None
             with self._ui_guard():
-                self.lbl_profile_id.setText("-")
-                self.le_display_name.setText("")
+                self._set_text(self.lbl_profile_id, "-")
+                self._set_text(self.le_display_name, "")
                 self._set_image_preview(self.lbl_profile_img, "")
             return
 
         prof = self._get_profile(profile_id)
+        self._active_profile = prof
 
         with self._ui_guard():
-            self.lbl_profile_id.setText(profile_id)
-            self.le_display_name.setText(prof.get("defaultDisplayName", "") or "")
+            self._set_text(self.lbl_profile_id, profile_id)
+            self._set_text(self.le_display_name, prof.get("defaultDisplayName", "") or "")
             self._set_image_preview(self.lbl_profile_img, prof.get("defaultProfileImage", "") or "")
 
     def _refresh_post_editor(self, profile_id: str | None, post_id: str | None) -> None:
+        self._flush_pending_edits()  # la saisie en attente va au post qu'on quitte
         enabled = bool(profile_id) and bool(post_id)
+        if self._defer_post_editor(enabled):
+            return
+        self._ensure_post_editor()
         self.grp_post.setEnabled(enabled)
 
         if not enabled:
-            with self._ui_guard():
-                self.lbl_post_id.setText("-")
+            self._active_post = None
+            with self._ui_guard(), self._block_post_editor_signals():
+                self._set_text(self.lbl_post_id, "-")
                 self._set_image_preview(self.lbl_post_img, "")
                 self.te_description.setPlainText("")
-                self.cb_timeslot.setCurrentText("all")
-                self.le_condition.setText("")
-                self.le_effect.setText("")
+                self._select_timeslot("all")
+                self._set_text(self.le_condition, "")
+                self._set_text(self.le_effect, "")
+                self._show_lewd_condition(None)
                 self._select_emoji_preset("")
-                self._set_emoji_values(self._default_emoji())
+                self._set_emoji_values(DEFAULT_EMOJI)
                 self._select_comment_set("")
             return
 
         post = self._get_post(profile_id, post_id)
+        self._active_post = post
 
-        with self._ui_guard():
-            self.lbl_post_id.setText(post_id)
+        self._ensure_emoji_grid_built()
+        with self._ui_guard(), self._block_post_editor_signals():
+            self._set_text(self.lbl_post_id, post_id)
             self._set_image_preview(self.lbl_post_img, post.get("pictureName", "") or "")
 
             self.te_description.setPlainText(post.get("description", "") or "")
-            self.cb_timeslot.setCurrentText(post.get("timeslot", "all") or "all")
-            self.le_condition.setText(post.get("conditionJS", "") or "")
-            self.le_effect.setText(post.get("effectJs", "") or "")
+            self._select_timeslot(post.get("timeslot", "all") or "all")
+            self._set_text(self.le_condition, post.get("conditionJS", "") or "")
+            self._set_text(self.le_effect, post.get("effectJs", "") or "")
+            self._show_lewd_condition(post)
 
             preset = (post.get("emojiPreset") or "").strip()
             if preset and preset in self._emoji_presets():
@@ -417,7 +481,7 @@ class PagePublicProfile(SocialProfilePageBase):
                 self._set_emoji_values(self._emoji_presets()[preset])
             else:
                 self._select_emoji_preset("")
-                self._set_emoji_values(post.get("emojiOverride") or self._default_emoji())
+                self._set_emoji_values(post.get("emojiOverride") or DEFAULT_EMOJI)
 
             self._select_comment_set(post.get("commentsSet", "") or "")
 
@@ -436,34 +500,41 @@ class PagePublicProfile(SocialProfilePageBase):
 
         prof = self._get_profile(profile_id)
         prof["order"] = self.shell.panel_profiles.list.count()
+        self._profiles_order_cache = None
 
         self.state.mark_dirty()
         self.shell.panel_profiles.clear_input()
 
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_profiles.list.findItems(profile_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_profiles.list.setCurrentItem(found[0])
+            self._reload_lists()
+            self.shell.panel_profiles.select_text(profile_id, scroll=False)
 
     def goto_post(self, profile_id: str, post_key: str, field: str = "") -> None:
-        with self._ui_guard():
-            self._refresh_profiles(preserve_selection=True)
-            p_items = self.panel_profiles.list.findItems(profile_id, Qt.MatchExactly)
-            if p_items:
-                self.panel_profiles.list.setCurrentItem(p_items[0])
-                self.panel_profiles.list.scrollToItem(p_items[0])
+        """
+        Navigation (ex: depuis la page Validation).
+        Les listes sont en général déjà à jour : on ne les recharge que si l'id est absent,
+        puis sélection directe par index (pas de findItems).
+        """
+        panel_profiles = self.shell.panel_profiles
+        if panel_profiles.index_of(profile_id) < 0:
+            self._reload_lists()
+        row = panel_profiles.index_of(profile_id)
+        if row < 0:
+            return
 
-            self._refresh_posts()
-            post_items = self.panel_posts.list.findItems(post_key, Qt.MatchExactly)
-            if post_items:
-                self.panel_posts.list.setCurrentItem(post_items[0])
-                self.panel_posts.list.scrollToItem(post_items[0])
+        # Change de profil seulement si nécessaire (le shell reconstruit alors les posts)
+        if panel_profiles.list.currentRow() != row:
+            panel_profiles.list.setCurrentRow(row)
+        panel_profiles.list.scrollToItem(panel_profiles.list.item(row))
 
-            # Optionnel : si tu as un widget spécifique pour emojiPreset/commentsSet, focus dessus.
-            # if field == "emojiPreset": self.combo_emojiPreset.setFocus()
-            # if field == "commentsSet": self.combo_commentsSet.setFocus()
+        if not self.shell.panel_posts.select_text(post_key):
+            return
+        self.shell.show_post_editor()
+
+        # Optionnel : si tu as un widget spécifique pour emojiPreset/commentsSet, focus dessus.
+        # if field == "emojiPreset": self.combo_emojiPreset.setFocus()
+        # if field == "commentsSet": self.combo_commentsSet.setFocus()
 
 
     def _profile_rename_from_typed(self, typed: str) -> None:
@@ -471,12 +542,13 @@ class PagePublicProfile(SocialProfilePageBase):
         if not old:
             return
 
-        if not typed.strip():
+        new = typed.strip()
+        if not new:
             self.shell.panel_profiles.input.setText(old)
             self.shell.panel_profiles.focus_input(select_all=True)
             return
 
-        self._profile_rename(old, typed.strip())
+        self._profile_rename(old, new)
 
     def _profile_rename(self, old: str, new: str) -> None:
         profiles = self._public_profiles()
@@ -487,15 +559,20 @@ class PagePublicProfile(SocialProfilePageBase):
             QMessageBox.warning(self, "Erreur", f"Le profil '{new}' existe déjà.")
             return
 
-        profiles[new] = profiles.pop(old)
+        self.state.rename_key(profiles, old, new)
+        cache = self._profiles_order_cache
+        if cache is not None:
+            cache[cache.index(old)] = new  # "order" inchangé : pas de re-tri
         self.state.mark_dirty()
         self.shell.panel_profiles.clear_input()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_profiles.list.findItems(new, Qt.MatchExactly)
-            if found:
-                self.shell.panel_profiles.list.setCurrentItem(found[0])
+            # Une seule ligne change : on renomme l'item au lieu de reconstruire les listes
+            if not self.shell.panel_profiles.rename_item(old, new):
+                self._reload_lists()
+                self.shell.panel_profiles.select_text(new, scroll=False)
+            else:
+                self._store_lists_snapshot()
 
     def _profile_delete(self) -> None:
         profile_id = self.shell.current_profile_id()
@@ -504,10 +581,13 @@ class PagePublicProfile(SocialProfilePageBase):
 
         # ListPanel fait déjà la confirmation
         self._public_profiles().pop(profile_id, None)
+        self._active_profile = self._active_post = None  # re-posés par les refresh ci-dessous
+        self._profiles_order_cache = None
+        self._profile_orders_contiguous = False  # trou dans la numérotation
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
+            self._reload_lists()
             prof = self.shell.current_profile_id()
             post = self.shell.current_post_id()
             self._refresh_profile_editor(prof)
@@ -530,27 +610,14 @@ class PagePublicProfile(SocialProfilePageBase):
             QMessageBox.warning(self, "Erreur", f"Le post '{post_id}' existe déjà.")
             return
 
-        posts[post_id] = {
-            "pictureName": "",
-            "description": "",
-            "timeslot": "all",
-            "conditionJS": "",
-            "effectJs": "",
-            "emojiPreset": "",
-            "emojiOverride": self._default_emoji(),
-            "commentsSet": "",
-            "lewdCondition": {"min": 0, "max": 999999},
-            "order": self.shell.panel_posts.list.count(),
-        }
+        posts[post_id] = self._fill_post_defaults({"order": self.shell.panel_posts.list.count()})
 
         self.state.mark_dirty()
         self.shell.panel_posts.clear_input()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_posts.list.findItems(post_id, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
+            self._reload_lists()
+            self.shell.panel_posts.select_text(post_id, scroll=False)
 
     def _post_rename_from_typed(self, typed: str) -> None:
         profile_id = self.shell.current_profile_id()
@@ -558,12 +625,13 @@ class PagePublicProfile(SocialProfilePageBase):
         if not profile_id or not old:
             return
 
-        if not typed.strip():
+        new = typed.strip()
+        if not new:
             self.shell.panel_posts.input.setText(old)
             self.shell.panel_posts.focus_input(select_all=True)
             return
 
-        self._post_rename(profile_id, old, typed.strip())
+        self._post_rename(profile_id, old, new)
 
     def _post_rename(self, profile_id: str, old: str, new: str) -> None:
         posts = self._profile_posts(profile_id)
@@ -574,15 +642,16 @@ class PagePublicProfile(SocialProfilePageBase):
             QMessageBox.warning(self, "Erreur", f"Le post '{new}' existe déjà.")
             return
 
-        posts[new] = posts.pop(old)
+        self.state.rename_key(posts, old, new)
         self.state.mark_dirty()
         self.shell.panel_posts.clear_input()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
-            found = self.shell.panel_posts.list.findItems(new, Qt.MatchExactly)
-            if found:
-                self.shell.panel_posts.list.setCurrentItem(found[0])
+            if not self.shell.panel_posts.rename_item(old, new):
+                self._reload_lists()
+                self.shell.panel_posts.select_text(new, scroll=False)
+            else:
+                self._store_lists_snapshot()
 
     def _post_delete(self) -> None:
         profile_id = self.shell.current_profile_id()
@@ -591,10 +660,11 @@ class PagePublicProfile(SocialProfilePageBase):
             return
 
         self._profile_posts(profile_id).pop(post_id, None)
+        self._active_post = None  # re-posé par _refresh_post_editor ci-dessous
         self.state.mark_dirty()
 
         with self._ui_guard():
-            self.shell.reload_lists(preserve_selection=True)
+            self._reload_lists()
             self._refresh_post_editor(self.shell.current_profile_id(), self.shell.current_post_id())
 
     # =========================================================
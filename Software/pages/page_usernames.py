@@ -3,11 +3,10 @@ from __future__ import annotations
 from contextlib import contextmanager
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QMessageBox, QInputDialog, QLineEdit
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
 
 from state import AppState
 from ui_helpers import ListPanel
-import copy
 
 
 class PageUsernames(QWidget):
@@ -16,9 +15,27 @@ class PageUsernames(QWidget):
         self.state = state
         self._building_ui = False
 
+        # (catégories dans l'ordre d'insertion, catégories triées) : pas de re-tri si rien n'a bougé
+        self._sorted_categories_cache: tuple[tuple[str, ...], list[str]] | None = None
+
+        # catégorie -> (liste indexée, sa longueur, username -> position) : lookups O(1),
+        # l'entrée est reconstruite si la liste a été remplacée ou a changé de taille
+        self._name_pos: dict[str, tuple[list, int, dict[str, int]]] = {}
+
+        # Dernier rendu de panel_names (catégorie, liste, longueur) : pas de rebuild si identique.
+        # On garde la liste elle-même (et pas id()) : un id recyclé ne peut pas tromper le test.
+        self._last_rendered: tuple[str, list, int] | None = None
+
+        # Rafale de dataChanged => un seul reload 50 ms plus tard, et seulement si la page est visible
+        self._reload_pending = False
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self.reload_from_state)
+
         self._build_ui()
 
-        self.state.dataChanged.connect(self.reload_from_state)
+        self.state.dataChanged.connect(self._schedule_reload)
         self.reload_from_state()
 
     @contextmanager
@@ -31,20 +48,20 @@ class PageUsernames(QWidget):
 
     def _set_dirty(self) -> None:
         self.state.mark_dirty()
-        self.state.dataChanged.emit()
+        self.state.notify_changed()
         
     def goto_pool(self, pool_id: str) -> None:
         with self._ui_guard():
             self._refresh_categories(preserve_selection=False)
-            found = self.panel_categories.list.findItems(pool_id, Qt.MatchExactly)
-            if found:
-                self.panel_categories.list.setCurrentItem(found[0])
-                self.panel_categories.list.scrollToItem(found[0])
+            if self.panel_categories.select_text(pool_id):
                 self._refresh_names()
 
 
     def _pools(self) -> dict:
-        return self.state.data.setdefault("usernames", {})
+        d = self.state.data.get("usernames")
+        if d is None:
+            d = self.state.data["usernames"] = {}
+        return d
 
     def _build_ui(self) -> None:
         root = QHBoxLayout(self)
@@ -86,7 +103,7 @@ class PageUsernames(QWidget):
         return {
             "kind": "username_category",
             "id": cat,
-            "data": copy.deepcopy(pools.get(cat, [])),
+            "data": pools.get(cat, []),  # sérialisé tout de suite par ListPanel
         }
 
     def _paste_category(self, payload: object) -> bool:
@@ -99,19 +116,30 @@ class PageUsernames(QWidget):
         if not isinstance(data, list):
             return False
 
-        new_id = ListPanel.make_unique_name(base, exists=lambda s: s in pools)
+        # Chaque collage crée sa copie (un 2e Ctrl+V rapproché est volontaire)
+        new_id = ListPanel.make_unique_name(base, existing=pools)
         pools[new_id] = list(data)
 
         self._set_dirty()
         self._refresh_categories(preserve_selection=False)
-        found = self.panel_categories.list.findItems(new_id, Qt.MatchExactly)
-        if found:
-            self.panel_categories.list.setCurrentItem(found[0])
-            self.panel_categories.list.scrollToItem(found[0])
+        self.panel_categories.select_text(new_id)
 
         return True
 
+    def _schedule_reload(self) -> None:
+        if not self.isVisible():
+            self._reload_pending = True
+            return
+        self._reload_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._reload_pending:
+            self.reload_from_state()
+
     def reload_from_state(self) -> None:
+        self._reload_pending = False
+        self._reload_timer.stop()
         with self._ui_guard():
             self._refresh_categories(preserve_selection=True)
             self._refresh_names()
@@ -123,20 +151,42 @@ class PageUsernames(QWidget):
         return self.panel_names.current_text()
 
     def _refresh_categories(self, preserve_selection: bool) -> None:
-        items = sorted(self._pools().keys())
+        sig = tuple(self._pools())
+        cache = self._sorted_categories_cache
+        if cache is None or cache[0] != sig:
+            cache = self._sorted_categories_cache = (sig, sorted(sig))
+        items = cache[1]
         self.panel_categories.set_items(items, preserve_selection=preserve_selection)
 
-    def _refresh_names(self) -> None:
+    def _refresh_names(self, force: bool = False) -> None:
+        """force=True après une modification de la liste elle-même (add/edit/delete)."""
         cat = self._current_category()
         pools = self._pools()
 
         if not cat:
+            self._last_rendered = None
             self.panel_names.set_items([], preserve_selection=False)
             self.panel_names.setEnabled(False)
             return
 
+        names = pools.get(cat, [])
+        last = self._last_rendered
+        if not force and last is not None and last[0] == cat and last[1] is names and last[2] == len(names):
+            return  # même catégorie, même liste : déjà affichée
+        self._last_rendered = (cat, names, len(names))
+
         self.panel_names.setEnabled(True)
-        self.panel_names.set_items(list(pools.get(cat, [])), preserve_selection=True)
+        # set_items ne garde pas de référence : pas besoin de copier la liste
+        self.panel_names.set_items(names, preserve_selection=True)
+
+    def _name_positions(self, cat: str, names: list) -> dict[str, int]:
+        entry = self._name_pos.get(cat)
+        if entry is None or entry[0] is not names or entry[1] != len(names):
+            pos: dict[str, int] = {}
+            for i in range(len(names) - 1, -1, -1):  # 1re occurrence gagne
+                pos[names[i]] = i
+            entry = self._name_pos[cat] = (names, len(names), pos)
+        return entry[2]
 
     def _on_category_changed(self) -> None:
         if self._building_ui:
@@ -158,9 +208,7 @@ class PageUsernames(QWidget):
 
         with self._ui_guard():
             self._refresh_categories(preserve_selection=False)
-            found = self.panel_categories.list.findItems(name, Qt.MatchExactly)
-            if found:
-                self.panel_categories.list.setCurrentItem(found[0])
+            self.panel_categories.select_text(name, scroll=False)
             self._refresh_names()
 
     def _edit_category(self, typed: str) -> None:
@@ -206,6 +254,7 @@ class PageUsernames(QWidget):
             return
 
         self._pools().pop(cat, None)
+        self._name_pos.pop(cat, None)
         self._set_dirty()
 
         with self._ui_guard():
@@ -227,8 +276,10 @@ class PageUsernames(QWidget):
         if not typed:
             return
 
+        pos = self._name_positions(cat, names)
+
         # Si déjà présent : on propose une édition avant d'ajouter
-        if typed in names:
+        if typed in pos:
             # Boucle : tant que l'utilisateur propose un nom déjà pris, on redemande
             current = typed
             while True:
@@ -250,7 +301,7 @@ class PageUsernames(QWidget):
                     current = ""
                     continue
 
-                if new_name in names:
+                if new_name in pos:
                     QMessageBox.warning(self, "Erreur", "Ce username existe déjà dans cette catégorie.")
                     current = new_name
                     continue
@@ -260,9 +311,11 @@ class PageUsernames(QWidget):
 
         # Ajout (soit direct, soit après édition)
         names.append(typed)
+        pos[typed] = len(names) - 1
+        self._name_pos[cat] = (names, len(names), pos)
         self.panel_names.clear_input()
         self._set_dirty()
-        self._refresh_names()
+        self._refresh_names(force=True)
 
     def _edit_name(self, typed: str) -> None:
         cat = self._current_category()
@@ -282,20 +335,22 @@ class PageUsernames(QWidget):
 
         pools = self._pools()
         names = pools.get(cat, [])
+        pos = self._name_positions(cat, names)
 
-        if new in names:
+        if new in pos:
             QMessageBox.warning(self, "Erreur", "Ce username existe déjà dans cette catégorie.")
             return
 
-        try:
-            idx = names.index(old)
-        except ValueError:
+        idx = pos.get(old)
+        if idx is None:
             return
 
         names[idx] = new
+        del pos[old]
+        pos[new] = idx
         self.panel_names.clear_input()
         self._set_dirty()
-        self._refresh_names()
+        self._refresh_names(force=True)
 
     def _delete_name(self) -> None:
         cat = self._current_category()
@@ -304,10 +359,11 @@ class PageUsernames(QWidget):
             return
 
         names = self._pools().get(cat, [])
-        try:
-            names.remove(old)
-        except ValueError:
+        idx = self._name_positions(cat, names).get(old)
+        if idx is None:
             return
+        del names[idx]
+        self._name_pos.pop(cat, None)  # positions décalées
 
         self._set_dirty()
-        self._refresh_names()
+        self._refresh_names(force=True)
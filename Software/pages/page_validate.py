@@ -1,7 +1,7 @@
 # Software/pages/page_validate.py
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTableWidget, QTableWidgetItem, QLabel
@@ -9,7 +9,12 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal
 
 from state import AppState
-from validators import validate_database
+from validators import validate_database_rows
+
+LEVEL_COLORS = {
+    "ERROR": Qt.GlobalColor.red,
+    "WARN": Qt.GlobalColor.darkYellow,
+}
 
 
 class PageValidate(QWidget):
@@ -36,49 +41,109 @@ class PageValidate(QWidget):
         layout.addLayout(top)
         layout.addWidget(self.table)
 
-        self.btn_run.clicked.connect(self.run_check)
-        self.state.dataChanged.connect(self.run_check)
+        # dataChanged => une seule vérification 250 ms après la dernière modif,
+        # et seulement si la page est visible (sinon au prochain showEvent)
+        self._check_pending = False
+        # Dernières lignes affichées (level, path, message) : évite de retoucher la table
+        self._last_rows: list[tuple[str, str, str]] = []
+        # state.revision au dernier run : rien n'a bougé => pas de re-validation
+        self._last_revision: int | None = None
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(250)
+        self._check_timer.timeout.connect(self.run_check)
+
+        self.btn_run.clicked.connect(self._run_check_now)
+        self.state.dataChanged.connect(self._schedule_check)
         self.table.itemDoubleClicked.connect(self._on_double_click)
 
-    def run_check(self) -> None:
-        issues = validate_database(self.state.data)
-
-        # Nettoyage PROPRE (indispensable)
-        self.table.setSortingEnabled(False)
-        self.table.clearContents()
-        self.table.setRowCount(0)
-
-        for it in issues:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Toujours créer de NOUVEAUX items
-            level_item = QTableWidgetItem(it.level)
-            path_item = QTableWidgetItem(it.path)
-            msg_item = QTableWidgetItem(it.message)
+    def _schedule_check(self) -> None:
+        if not self.isVisible():
+            self._check_pending = True
+            return
+        self._check_timer.start()
 
-            # Stockage du path pour la navigation
-            path_item.setData(Qt.ItemDataRole.UserRole, it.path)
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._check_pending:
+            self.run_check()
 
-            if it.level == "ERROR":
-                level_item.setForeground(Qt.GlobalColor.red)
-            elif it.level == "WARN":
-                level_item.setForeground(Qt.GlobalColor.darkYellow)
+    def _run_check_now(self) -> None:
+        # Clic explicite : toujours re-valider (des données ont pu bouger sans mark_dirty)
+        self._last_revision = None
+        self.run_check()
 
-            self.table.setItem(row, 0, level_item)
-            self.table.setItem(row, 1, path_item)
-            self.table.setItem(row, 2, msg_item)
+    def run_check(self) -> None:
+        self._check_pending = False
+        self._check_timer.stop()
+        revision = self.state.revision
+        if revision == self._last_revision:
+            return
+        self._last_revision = revision
 
-        self.table.setSortingEnabled(True)
+        # Tuples (level, path, message) : la forme que la table consomme, sans objets Issue
+        rows = validate_database_rows(self.state.data)
+        if rows != self._last_rows:
+            self._last_rows = rows
+            self._fill_table(rows)
 
-        if not issues:
+        if not rows:
             self.label.setText("✅ Aucun problème détecté.")
         else:
-            errors = sum(1 for x in issues if x.level == "ERROR")
-            warns = sum(1 for x in issues if x.level == "WARN")
+            errors = sum(1 for x in rows if x[0] == "ERROR")
+            warns = sum(1 for x in rows if x[0] == "WARN")
             self.label.setText(f"Résultat : {errors} erreur(s), {warns} warning(s).")
 
 
+    @staticmethod
+    def _make_row(level: str, path: str, message: str) -> tuple[QTableWidgetItem, ...]:
+        """Crée les 3 items d'une nouvelle ligne."""
+        level_item = QTableWidgetItem(level)
+        path_item = QTableWidgetItem(path)
+        msg_item = QTableWidgetItem(message)
+
+        # Stockage du path pour la navigation
+        path_item.setData(Qt.ItemDataRole.UserRole, path)
+
+        color = LEVEL_COLORS.get(level)
+        if color is not None:
+            level_item.setForeground(color)
+        return level_item, path_item, msg_item
+
+    def _fill_table(self, rows: list[tuple[str, str, str]]) -> None:
+        """Met à jour la table en réutilisant les items existants (alloue seulement les nouvelles lignes)."""
+        table = self.table
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)   # sinon setText re-trie pendant la boucle
+        try:
+            old_count = table.rowCount()
+            table.setRowCount(len(rows))
+
+            # Lignes existantes : on retouche les items en place
+            for row in range(min(old_count, len(rows))):
+                level, path, message = rows[row]
+                level_item = table.item(row, 0)
+                path_item = table.item(row, 1)
+
+                if level_item.text() != level:
+                    level_item.setText(level)
+                    color = LEVEL_COLORS.get(level)
+                    if color is not None:
+                        level_item.setForeground(color)
+                    else:
+                        level_item.setData(Qt.ItemDataRole.ForegroundRole, None)
+                path_item.setText(path)
+                path_item.setData(Qt.ItemDataRole.UserRole, path)
+                table.item(row, 2).setText(message)
+
+            # Nouvelles lignes seulement : allocation des items
+            for row in range(old_count, len(rows)):
+                for col, item in enumerate(self._make_row(*rows[row])):
+                    table.setItem(row, col, item)
+        finally:
+            table.setSortingEnabled(True)
+            table.setUpdatesEnabled(True)
+
     def _on_double_click(self, item) -> None:
         # On récupère le path depuis la colonne "Chemin" (1)
         row = item.row()
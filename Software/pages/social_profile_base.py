@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import copy
 import os
-from contextlib import contextmanager
-from typing import Any
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Callable
 
-from PySide6.QtCore import Qt, QSignalBlocker
-from PySide6.QtGui import QPixmap, QIntValidator
+from PySide6.QtCore import Qt, QCoreApplication, QSignalBlocker, QStringListModel, QTimer, QEvent, Slot
+from PySide6.QtGui import QGuiApplication, QPixmap, QPixmapCache, QIntValidator
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QGroupBox,
     QLabel, QLineEdit, QTextEdit, QComboBox, QPushButton, QFrame,
@@ -13,7 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from state import AppState
-from social_editor_shell import HELP_EFFECT_JS, HELP_CONDITION_JS, TIME_SLOTS
+from social_editor_shell import HELP_EFFECT_JS, HELP_CONDITION_JS, TIME_SLOTS, TIME_SLOT_INDEX
 from ui_helpers import NoWheelComboBox, ClickableImageLabel
 
 # ============================================================
@@ -53,31 +55,143 @@ RESET_BTN_WIDTH = 80
 # Validators
 INT_MAX = 999999
 
+# Feuilles de style partagées (une seule chaîne par style, pas un littéral par construction)
+_ID_LABEL_QSS = "QLabel{font-size: 20px; font-weight: 600; padding: 6px 8px;}"
+# Style des cellules emoji, posé une seule fois sur l'hôte de la grille (sélecteurs par objectName)
+_EMOJI_GRID_QSS = (
+    "#emojiGrid QFrame#emojiCell{border:1px solid #444;border-radius:6px;padding:6px;}"
+    "#emojiGrid QLabel#emojiIcon{border:none;background:transparent;padding:0px 4px;}"
+    "#emojiGrid QLabel#emojiTo{border:none;background:transparent;padding:0px 6px;}"
+)
+
+# Textes des aperçus sans image
+_TXT_NO_IMAGE = "Double-clic pour choisir\nune image"
+_TXT_MISSING = "Image introuvable:\n{}\n\n(double-clic pour choisir)"
+_TXT_BAD = "Impossible de lire:\n{}\n\n(double-clic)"
+
+SOCIAL_IMG_DIR_DEFAULT = r"C:\Users\nicol\Desktop\Pentania Studio\The Elf Next Stream\img\pictures\Social"
+
+# Override emoji par défaut. Lecture seule : copier (_default_emoji) avant de le stocker dans un post
+DEFAULT_EMOJI: dict[str, dict[str, int]] = {
+    "up": {"min": 0, "max": 0},
+    "down": {"min": 0, "max": 0},
+    "heart": {"min": 0, "max": 0},
+    "comment": {"min": 0, "max": 0},
+}
+
+# Champs toujours présents sur un post initialisé (cf. _get_post des pages)
+POST_DEFAULTS: dict[str, Any] = {
+    "pictureName": "",
+    "description": "",
+    "timeslot": "all",
+    "conditionJS": "",
+    "effectJs": "",
+    "emojiPreset": "",      # "" => custom
+    "emojiOverride": DEFAULT_EMOJI,  # copié par _fill_post_defaults
+    "commentsSet": "",
+    "lewdCondition": {"min": 0, "max": 999999},
+}
+POST_DEFAULT_KEYS = frozenset(POST_DEFAULTS)
+
 
 class SocialProfilePageBase(QWidget):
     PROFILE_GROUP_TITLE = "Profile"
+    # Ordre des cellules de la grille emoji : index i des tableaux _emoji_* => EMOJI_KEYS[i]
+    EMOJI_KEYS = ("up", "down", "heart", "comment")
     USES_PROFILE_SCOPE_FOR_POST = False
 
+    # QFont.key() -> lineSpacing : partagé entre instances (même police => même métrique)
+    _line_spacing_cache: dict[str, int] = {}
+
+    # Créneaux (statiques) : un seul modèle pour tous les combos timeslot, créé au 1er besoin
+    _timeslot_model: QStringListModel | None = None
+    # Validator 0..INT_MAX : identique pour toutes les pages, partagé comme le modèle timeslot
+    _int_validator_shared: QIntValidator | None = None
+
     def __init__(self, state: AppState):
         super().__init__()
         self.state = state
 
-        # Ton dossier images
-        self.social_img_dir = r"C:\Users\nicol\Desktop\Pentania Studio\The Elf Next Stream\img\pictures\Social"
-
-        self._building_ui = False
-
-        # Editors
+        # Ton dossier images (surchargeable via SOCIAL_IMG_DIR), normalisé une seule fois
+        self._social_img_base = Path(os.environ.get("SOCIAL_IMG_DIR") or SOCIAL_IMG_DIR_DEFAULT)
+        self.social_img_dir = str(self._social_img_base)
+        # Dossier constant : validé une seule fois (repli du file dialog)
+        self._social_img_fallback = self.social_img_dir if self._social_img_base.is_dir() else os.getcwd()
+        # relpath normalisé -> chemin absolu (résolu une seule fois par relpath)
+        self._image_paths: dict[str, str] = {}
+        # chemin absolu -> st_mtime_ns (None = introuvable) : pas de stat par aperçu.
+        # Vidé après un choix d'image et au retour dans l'app (fichiers modifiés ailleurs).
+        self._image_mtimes: dict[str, int | None] = {}
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
+
+        # Validator numérique (0..999999) partagé par tous les champs entiers du post (lewd + emoji)
+        self._int_validator = self._shared_int_validator()
+
+        # (clés dans l'ordre d'insertion, clés triées) des presets / comment sets :
+        # le tri n'est refait que si le dict a changé (ajout, suppression, renommage)
+        self._emoji_preset_keys_cache: tuple[tuple[str, ...], list[str]] | None = None
+        self._comment_set_keys_cache: tuple[tuple[str, ...], list[str]] | None = None
+        # Listes actuellement affichées dans les combos : pas de clear()/repeuplement si identiques
+        self._last_presets: list[str] | None = None
+        self._last_comment_sets: list[str] | None = None
+
+        # Profondeur de _ui_guard (compteur => les guards imbriqués restent corrects)
+        self._ui_guard_depth = 0
+
+        # Profil / post affichés dans les éditeurs (références live), posés par
+        # _refresh_profile_editor / _refresh_post_editor : les handlers de frappe écrivent
+        # directement dedans au lieu de re-résoudre shell.current_*() + _get_post à chaque touche
+        self._active_profile: dict[str, Any] | None = None
+        self._active_post: dict[str, Any] | None = None
+
+        # Saisies texte différées : champ -> (dict cible, lecture du widget). Écrites 150 ms après
+        # la dernière frappe (ou au focus-out / changement de sélection / save), pas à chaque
+        # touche. La cible est figée à la frappe : la sélection peut changer entre-temps.
+        self._pending_edits: dict[str, tuple[dict[str, Any], Callable[[], Any]]] = {}
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(150)
+        self._edit_timer.timeout.connect(self._flush_pending_edits)
+        self.state.flushRequested.connect(self._flush_pending_edits)
+
+        # Editors. L'éditeur post (le plus lourd) n'est construit qu'au premier post affiché
+        # (_ensure_post_editor) : d'ici là le shell reçoit un placeholder vide.
         self._profile_editor = self._build_profile_editor()
-        self._post_editor = self._build_post_editor()
+        self._post_editor: QWidget = QWidget()
+        self._post_editor_built = False
+        # Un post était à afficher alors que la page était cachée : refresh au showEvent
+        self._post_editor_pending = False
 
     @contextmanager
     def _ui_guard(self):
-        self._building_ui = True
+        """
+        Coupe les handlers pendant un refresh programmatique.
+        Réentrant : un guard imbriqué ne relâche pas celui du dessus,
+        et une exception ne laisse pas la page verrouillée.
+        """
+        self._ui_guard_depth += 1
         try:
             yield
         finally:
-            self._building_ui = False
+            self._ui_guard_depth -= 1
+
+    def _block_post_editor_signals(self) -> ExitStack:
+        """
+        QSignalBlocker sur tous les champs du post (à utiliser avec `with`) :
+        pendant un refresh, les setText/setCurrentIndex n'atteignent même pas Python.
+        """
+        stack = ExitStack()
+        for w in (
+            self.te_description, self.cb_timeslot,
+            self.le_lewd_min, self.le_lewd_max,
+            self.le_condition, self.le_effect,
+            self.cb_emoji_preset, self.cb_comment_set,
+            *self._emoji_mins, *self._emoji_maxs,
+        ):
+            stack.enter_context(QSignalBlocker(w))
+        return stack
 
     # =========================================================
     # Abstract-ish hooks
@@ -115,44 +229,90 @@ class SocialProfilePageBase(QWidget):
             return None
         return self._get_post_data(profile_id, post_id)
 
-    def _default_emoji(self) -> dict[str, Any]:
-        return {
-            "up": {"min": 0, "max": 0},
-            "down": {"min": 0, "max": 0},
-            "heart": {"min": 0, "max": 0},
-            "comment": {"min": 0, "max": 0},
-        }
+    @staticmethod
+    def _default_emoji() -> dict[str, Any]:
+        """Copie modifiable de DEFAULT_EMOJI (pour un post). Affichage seul : DEFAULT_EMOJI."""
+        return copy.deepcopy(DEFAULT_EMOJI)
+
+    @staticmethod
+    def _set_text(widget: QLabel | QLineEdit, text: str) -> None:
+        """
+        setText seulement si le texte change (pas de reset curseur/undo ni de relayout inutile).
+        Un QLineEdit qui a un historique d'undo est quand même réécrit : l'undo ne doit pas
+        survivre au changement de post.
+        """
+        if widget.text() == text:
+            if not isinstance(widget, QLineEdit) or not widget.isUndoAvailable():
+                return
+        widget.setText(text)
+
+    @staticmethod
+    def _shared_timeslot_model() -> QStringListModel:
+        model = SocialProfilePageBase._timeslot_model
+        if model is None:
+            # Parent = l'application : détruit avec elle, pas par une page
+            model = QStringListModel(list(TIME_SLOTS), QCoreApplication.instance())
+            SocialProfilePageBase._timeslot_model = model
+        return model
+
+    @staticmethod
+    def _shared_int_validator() -> QIntValidator:
+        validator = SocialProfilePageBase._int_validator_shared
+        if validator is None:
+            validator = QIntValidator(0, INT_MAX, QCoreApplication.instance())
+            SocialProfilePageBase._int_validator_shared = validator
+        return validator
+
+    @classmethod
+    def _line_spacing(cls, widget: QWidget) -> int:
+        key = widget.font().key()
+        spacing = cls._line_spacing_cache.get(key)
+        if spacing is None:
+            spacing = cls._line_spacing_cache[key] = widget.fontMetrics().lineSpacing()
+        return spacing
+
+    @staticmethod
+    def _fill_post_defaults(post: dict[str, Any]) -> dict[str, Any]:
+        """Complète un post en une passe (valeurs mutables copiées) ; no-op s'il est déjà complet."""
+        if post.keys() >= POST_DEFAULT_KEYS:
+            return post  # déjà initialisé (cas courant) : un seul test
+        for key, value in POST_DEFAULTS.items():
+            if key not in post:
+                post[key] = copy.deepcopy(value) if isinstance(value, dict) else value
+        return post
 
     def _emoji_presets(self) -> dict[str, Any]:
-        return self.state.data.setdefault("emojiPresets", {})
+        d = self.state.data.get("emojiPresets")
+        if d is None:
+            d = self.state.data["emojiPresets"] = {}
+        return d
 
     def _comment_sets(self) -> dict[str, Any]:
-        return self.state.data.setdefault("commentSets", {})
+        d = self.state.data.get("commentSets")
+        if d is None:
+            d = self.state.data["commentSets"] = {}
+        return d
 
     # =========================================================
     # Build editors (shared)
     # =========================================================
     def _build_profile_editor(self) -> QWidget:
         w = QWidget()
+        w.setUpdatesEnabled(False)  # pas de repaint intermédiaire pendant l'assemblage
         root = QVBoxLayout(w)
 
         grp = QGroupBox(self.PROFILE_GROUP_TITLE)
         grp.setMaximumWidth(PROFILE_EDITOR_MAX_WIDTH)
-        form = QFormLayout(grp)
+        form = QFormLayout()  # posé sur grp une fois rempli
 
         self.lbl_profile_id = QLabel("-")
         self.lbl_profile_id.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.lbl_profile_id.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-        self.lbl_profile_id.setStyleSheet("""
-            QLabel{
-                font-size: 20px;
-                font-weight: 600;
-                padding: 6px 8px;
-            }
-        """)
+        self.lbl_profile_id.setStyleSheet(_ID_LABEL_QSS)
 
         self.le_display_name = QLineEdit()
         self.le_display_name.textEdited.connect(self._on_profile_changed)
+        self.le_display_name.editingFinished.connect(self._flush_pending_edits)
 
         self.lbl_profile_img = ClickableImageLabel()
         self.lbl_profile_img.on_double_click = self._pick_profile_image
@@ -174,14 +334,17 @@ class SocialProfilePageBase(QWidget):
 
         form.addRow("", self.lbl_profile_id)
         form.addRow("", header)
+        grp.setLayout(form)
 
         root.addStretch(1)
         root.addWidget(grp, 0, alignment=Qt.AlignHCenter | Qt.AlignTop)
         root.addStretch(2)
+        w.setUpdatesEnabled(True)
         return w
 
     def _build_post_editor(self) -> QWidget:
         w = QWidget()
+        w.setUpdatesEnabled(False)  # pas de repaint intermédiaire pendant l'assemblage
         root = QVBoxLayout(w)
         w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         root.setContentsMargins(0, 0, 0, 0)
@@ -189,7 +352,7 @@ class SocialProfilePageBase(QWidget):
         self.grp_post = QGroupBox("")
         self.grp_post.setMaximumWidth(POST_EDITOR_MAX_WIDTH)
         self.grp_post.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
-        form = QVBoxLayout(self.grp_post)
+        form = QVBoxLayout()  # posé sur grp_post une fois rempli
         form.setContentsMargins(*POST_FORM_MARGINS)
         form.setSpacing(POST_FORM_SPACING)
 
@@ -202,21 +365,22 @@ class SocialProfilePageBase(QWidget):
 
         self.te_description = QTextEdit()
         self.te_description.textChanged.connect(self._on_post_description_changed)
+        self.te_description.installEventFilter(self)
 
         self.cb_timeslot = NoWheelComboBox()
         self.cb_timeslot.setSizeAdjustPolicy(QComboBox.AdjustToContents)
         self.cb_timeslot.setMinimumContentsLength(10)   # réserve une largeur min (chars)
         self.cb_timeslot.setSizePolicy(self.cb_timeslot.sizePolicy().horizontalPolicy(), self.cb_timeslot.sizePolicy().verticalPolicy())
-        self.cb_timeslot.addItems(list(TIME_SLOTS))
-        self.cb_timeslot.currentIndexChanged.connect(self._on_post_simple_changed)
+        self.cb_timeslot.setModel(self._shared_timeslot_model())
+        self.cb_timeslot.currentIndexChanged.connect(self._on_timeslot_changed)
 
         self.le_lewd_min = QLineEdit()
-        self.le_lewd_min.setValidator(QIntValidator(0, INT_MAX, self))
-        self.le_lewd_min.textEdited.connect(self._on_post_simple_changed)
+        self.le_lewd_min.setValidator(self._int_validator)
+        self.le_lewd_min.textEdited.connect(self._on_lewd_min_changed)
 
         self.le_lewd_max = QLineEdit()
-        self.le_lewd_max.setValidator(QIntValidator(0, INT_MAX, self))
-        self.le_lewd_max.textEdited.connect(self._on_post_simple_changed)
+        self.le_lewd_max.setValidator(self._int_validator)
+        self.le_lewd_max.textEdited.connect(self._on_lewd_max_changed)
 
         row_lewd = QWidget()
         row_lewd_lay = QHBoxLayout(row_lewd)
@@ -231,10 +395,12 @@ class SocialProfilePageBase(QWidget):
         row_lewd_lay.addStretch(1)
 
         self.le_condition = QLineEdit()
-        self.le_condition.textEdited.connect(self._on_post_simple_changed)
+        self.le_condition.textEdited.connect(self._on_condition_changed)
+        self.le_condition.editingFinished.connect(self._flush_pending_edits)
 
         self.le_effect = QLineEdit()
-        self.le_effect.textEdited.connect(self._on_post_simple_changed)
+        self.le_effect.textEdited.connect(self._on_effect_changed)
+        self.le_effect.editingFinished.connect(self._flush_pending_edits)
 
         self.le_condition.setToolTip(HELP_CONDITION_JS)
         self.le_effect.setToolTip(HELP_EFFECT_JS)
@@ -260,6 +426,9 @@ class SocialProfilePageBase(QWidget):
 
         self.cb_emoji_preset = NoWheelComboBox()
         self.cb_emoji_preset.setMinimumWidth(EMOJI_PRESET_MIN_WIDTH)
+        # Repeuplé d'un bloc via setStringList (un seul reset du modèle)
+        self._emoji_preset_model = QStringListModel(["(custom)"], self)
+        self.cb_emoji_preset.setModel(self._emoji_preset_model)
         self.cb_emoji_preset.currentIndexChanged.connect(self._on_emoji_preset_selected)
 
         self.btn_emoji_reset = QPushButton("Reset")
@@ -272,80 +441,31 @@ class SocialProfilePageBase(QWidget):
         emoji_layout.addLayout(row_preset)
 
         # ✅ Grille compacte (QLineEdit au lieu de QSpinBox)
-        grid = QGridLayout()
+        # Construite à la première activation de l'éditeur post (_ensure_emoji_grid_built) :
+        # ici on ne pose que le conteneur.
+        self._emoji_grid_host = QWidget()
+        self._emoji_grid_host.setObjectName("emojiGrid")
+        self._emoji_grid_host.setStyleSheet(_EMOJI_GRID_QSS)
+        grid = QGridLayout(self._emoji_grid_host)
         grid.setHorizontalSpacing(10)
         grid.setVerticalSpacing(8)
         grid.setContentsMargins(0, 0, 0, 0)
 
-        # Validator numérique (0..999999)
-        self._emoji_int_validator = QIntValidator(0, INT_MAX, self)
-
-        # Stocke les inputs: (key,"min"/"max") -> QLineEdit
-        self.emoji_inputs: dict[tuple[str, str], QLineEdit] = {}
-
-        cells = [
-            ("up", 0, 0, "👍 Like"),
-            ("down", 0, 1, "👎 Dislike"),
-            ("heart", 1, 0, "❤️ Love"),
-            ("comment", 1, 1, "💬 Comment"),
-        ]
-
-        def _make_int_le() -> QLineEdit:
-            le = QLineEdit()
-            le.setValidator(self._emoji_int_validator)
-            le.setFixedWidth(64)          # encore plus compact
-            le.setAlignment(Qt.AlignCenter)
-            le.setFrame(False)
-            return le
-
-        for key, r, c, icon in cells:
-            frame = QFrame()
-            frame.setFrameShape(QFrame.NoFrame)
-            frame.setStyleSheet("QFrame{border:1px solid #444;border-radius:6px;padding:6px;}")
-
-            cell_layout = QVBoxLayout(frame)
-            cell_layout.setContentsMargins(4, 4, 4, 4)
-            cell_layout.setSpacing(4)
-
-            lbl = QLabel(icon)
-            lbl.setAlignment(Qt.AlignHCenter)
-            lbl.setStyleSheet("QLabel{border:none;background:transparent;padding:0px 4px;}")
-            cell_layout.addWidget(lbl)
-
-            row = QHBoxLayout()
-            row.setContentsMargins(0, 0, 0, 0)
-            row.setSpacing(6)
-            row.setAlignment(Qt.AlignHCenter)
-
-            le_min = _make_int_le()
-            le_max = _make_int_le()
-            self.emoji_inputs[(key, "min")] = le_min
-            self.emoji_inputs[(key, "max")] = le_max
-
-            # Toute modif => détache preset + save override
-            le_min.textEdited.connect(lambda _t, k=key: self._on_emoji_value_changed(k))
-            le_max.textEdited.connect(lambda _t, k=key: self._on_emoji_value_changed(k))
-
-            row.addStretch(1)
-
-            row.addWidget(le_min)
-
-            lbl_to = QLabel("to")
-            lbl_to.setStyleSheet("QLabel{border:none;background:transparent;padding:0px 6px;}")
-            row.addWidget(lbl_to)
-
-            row.addWidget(le_max)
-
-            row.addStretch(1)
+        # Cellules en tableaux parallèles (ordre EMOJI_KEYS) : index i => champs, bornes.
+        # _emoji_bounds[i] = {"min", "max"} tel qu'affiché, tenu à jour cellule par cellule
+        # (frappe ou _set_emoji_values) : l'override se lit sans re-parser les 8 champs
+        self._emoji_mins: list[QLineEdit] = []
+        self._emoji_maxs: list[QLineEdit] = []
+        self._emoji_bounds: list[dict[str, int]] = []
+        self._emoji_grid_built = False
 
-            cell_layout.addLayout(row)
-            grid.addWidget(frame, r, c)
-
-        emoji_layout.addLayout(grid)
+        emoji_layout.addWidget(self._emoji_grid_host)
 
         # Comment set dropdown
         self.cb_comment_set = NoWheelComboBox()
-        self.cb_comment_set.currentIndexChanged.connect(self._on_post_simple_changed)
+        self._comment_set_model = QStringListModel([""], self)
+        self.cb_comment_set.setModel(self._comment_set_model)
+        self.cb_comment_set.currentIndexChanged.connect(self._on_commentset_changed)
 
         self.cb_comment_set.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         
@@ -372,13 +492,7 @@ class SocialProfilePageBase(QWidget):
 
         # Post ID (gros + centré)
         self.lbl_post_id.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-        self.lbl_post_id.setStyleSheet("""
-            QLabel{
-                font-size: 20px;
-                font-weight: 600;
-                padding: 6px 8px;
-            }
-        """)
+        self.lbl_post_id.setStyleSheet(_ID_LABEL_QSS)
 
         right_col.addWidget(self.lbl_post_id, 0, alignment=Qt.AlignHCenter)
 
@@ -389,8 +503,7 @@ class SocialProfilePageBase(QWidget):
         # La description doit s'étirer dans la largeur du bloc Post
         self.te_description.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.te_description.setMinimumWidth(DESCRIPTION_MIN_WIDTH)
-        line_height = self.te_description.fontMetrics().lineSpacing()
-        self.te_description.setFixedHeight(line_height * DESCRIPTION_LINES + 12)
+        self._fit_description_height()
         right_col.addWidget(self.te_description)
 
         # Un peu d'air en bas pour occuper la hauteur restante
@@ -407,7 +520,9 @@ class SocialProfilePageBase(QWidget):
         form.addWidget(self._make_scaled_section("Condition JD", self.le_condition))
         form.addWidget(self._make_scaled_section("Effect", self.le_effect))
         form.addWidget(self._make_scaled_section("Comments set", self.cb_comment_set))
-        form.addWidget(self._center(grp_emoji))
+        # Alignement porté par le layout : pas de wrapper QWidget + stretches
+        form.addWidget(grp_emoji, 0, Qt.AlignHCenter)
+        self.grp_post.setLayout(form)
 
         root.addStretch(1)
         wrapper = QWidget()
@@ -421,16 +536,7 @@ class SocialProfilePageBase(QWidget):
 
         root.addWidget(wrapper)
         root.addStretch(2)
-        return w
-
-    def _center(self, widget: QWidget) -> QWidget:
-        """Retourne un widget wrapper qui centre 'widget' horizontalement."""
-        w = QWidget()
-        lay = QHBoxLayout(w)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.addStretch(1)
-        lay.addWidget(widget, 0)
-        lay.addStretch(1)
+        w.setUpdatesEnabled(True)
         return w
 
     def _make_scaled_section(self, title: str, widget: QWidget) -> QWidget:
@@ -457,24 +563,143 @@ class SocialProfilePageBase(QWidget):
         label.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
         layout.addWidget(label)
 
-        layout.addWidget(self._center(widget))
+        layout.addWidget(widget, 0, Qt.AlignHCenter)
         return section
         
+    def _ensure_emoji_grid_built(self) -> None:
+        """Construit la grille emoji (4 cellules, 8 QLineEdit) au premier besoin."""
+        if self._emoji_grid_built:
+            return
+        self._emoji_grid_built = True
+
+        grid = self._emoji_grid_host.layout()
+        # L'hôte est déjà affiché : un seul repaint une fois les 4 cellules posées
+        self._emoji_grid_host.setUpdatesEnabled(False)
+        grid.addWidget(self._build_emoji_cell("up", "👍 Like"), 0, 0)
+        grid.addWidget(self._build_emoji_cell("down", "👎 Dislike"), 0, 1)
+        grid.addWidget(self._build_emoji_cell("heart", "❤️ Love"), 1, 0)
+        grid.addWidget(self._build_emoji_cell("comment", "💬 Comment"), 1, 1)
+        self._emoji_grid_host.setUpdatesEnabled(True)
+
+    def _make_emoji_int_le(self, index: int) -> QLineEdit:
+        le = QLineEdit()
+        le.setValidator(self._int_validator)
+        le.setFixedWidth(64)          # encore plus compact
+        le.setAlignment(Qt.AlignCenter)
+        le.setFrame(False)
+        # Toute modif => détache preset + save override (un seul slot, index porté par le widget)
+        le.setProperty("emojiIndex", index)
+        le.textEdited.connect(self._on_any_emoji_edited)
+        return le
+
+    def _build_emoji_cell(self, key: str, icon: str) -> QFrame:
+        """Une cellule emoji (icône + min "to" max), enregistrée dans les tableaux _emoji_*."""
+        index = self.EMOJI_KEYS.index(key)  # appelée dans l'ordre EMOJI_KEYS (index == len)
+        le_min = self._make_emoji_int_le(index)
+        le_max = self._make_emoji_int_le(index)
+        self._emoji_mins.append(le_min)
+        self._emoji_maxs.append(le_max)
+        self._emoji_bounds.append({"min": 0, "max": 0})
+
+        frame = QFrame()
+        frame.setObjectName("emojiCell")
+        frame.setFrameShape(QFrame.NoFrame)
+
+        lbl = QLabel(icon)
+        lbl.setObjectName("emojiIcon")
+        lbl.setAlignment(Qt.AlignHCenter)
+
+        lbl_to = QLabel("to")
+        lbl_to.setObjectName("emojiTo")
+
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(6)
+        row.setAlignment(Qt.AlignHCenter)
+        row.addStretch(1)
+        row.addWidget(le_min)
+        row.addWidget(lbl_to)
+        row.addWidget(le_max)
+        row.addStretch(1)
+
+        # Layout posé sur le frame une fois rempli : pas de re-layout par widget ajouté
+        cell_layout = QVBoxLayout()
+        cell_layout.setContentsMargins(4, 4, 4, 4)
+        cell_layout.setSpacing(4)
+        cell_layout.addWidget(lbl)
+        cell_layout.addLayout(row)
+        frame.setLayout(cell_layout)
+        return frame
+
+    @staticmethod
+    def _sorted_keys_cached(
+        cache: tuple[tuple[str, ...], list[str]] | None, d: dict[str, Any]
+    ) -> tuple[tuple[str, ...], list[str]]:
+        sig = tuple(d)
+        if cache is None or cache[0] != sig:
+            cache = (sig, sorted(sig))
+        return cache
+
+    def _defer_post_editor(self, enabled: bool) -> bool:
+        """
+        True si _refresh_post_editor peut s'arrêter là : éditeur jamais construit et rien à
+        afficher, ou page cachée (la construction attend le showEvent).
+        """
+        if self._post_editor_built:
+            return False
+        if enabled and self.isVisible():
+            return False
+        self._active_post = None
+        self._post_editor_pending = enabled
+        return True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._post_editor_pending:
+            self._post_editor_pending = False
+            self.reload_from_state()
+
+    def hideEvent(self, event):
+        # Changement d'onglet : la dernière saisie différée est écrite tout de suite
+        self._flush_pending_edits()
+        super().hideEvent(event)
+
+    def _ensure_post_editor(self) -> None:
+        """Construit l'éditeur post au premier besoin et le substitue au placeholder du shell."""
+        if self._post_editor_built:
+            return
+        self._post_editor_built = True
+        self._post_editor = self._build_post_editor()
+        self.shell.set_post_editor(self._post_editor)
+        self._refresh_emoji_preset_dropdown()
+        self._refresh_comment_set_dropdown()
+
     def _refresh_emoji_preset_dropdown(self) -> None:
-        presets = sorted(self._emoji_presets().keys())
+        if not self._post_editor_built:
+            return  # rempli à la construction de l'éditeur
+        self._emoji_preset_keys_cache = self._sorted_keys_cached(
+            self._emoji_preset_keys_cache, self._emoji_presets()
+        )
+        presets = self._emoji_preset_keys_cache[1]
+        # Clés inchangées => même liste (identité, O(1)) ; sinon comparaison du contenu trié
+        if presets is self._last_presets or presets == self._last_presets:
+            return
+        self._last_presets = presets
         with QSignalBlocker(self.cb_emoji_preset):
-            self.cb_emoji_preset.clear()
-            self.cb_emoji_preset.addItem("(custom)")
-            for p in presets:
-                self.cb_emoji_preset.addItem(p)
+            self._emoji_preset_model.setStringList(["(custom)", *presets])
 
     def _refresh_comment_set_dropdown(self) -> None:
-        sets = sorted(self._comment_sets().keys())
+        if not self._post_editor_built:
+            return
+        self._comment_set_keys_cache = self._sorted_keys_cached(
+            self._comment_set_keys_cache, self._comment_sets()
+        )
+        sets = self._comment_set_keys_cache[1]
+        if sets is self._last_comment_sets or sets == self._last_comment_sets:
+            return
+        self._last_comment_sets = sets
         with QSignalBlocker(self.cb_comment_set):
-            self.cb_comment_set.clear()
-            self.cb_comment_set.addItem("")
-            for s in sets:
-                self.cb_comment_set.addItem(s)
+            self._comment_set_model.setStringList(["", *sets])
 
     # =========================================================
     # Image preview + pickers
@@ -482,35 +707,58 @@ class SocialProfilePageBase(QWidget):
     def _set_image_preview(self, label: ClickableImageLabel, relpath: str) -> None:
         relpath = (relpath or "").strip().replace("\\", "/")
         if not relpath:
-            label.setPixmap(QPixmap())
-            label.setText("Double-clic pour choisir\nune image")
+            label.show_placeholder(_TXT_NO_IMAGE)
             return
 
-        path = relpath
-        if not os.path.isabs(path):
-            path = os.path.join(self.social_img_dir, relpath.replace("/", os.sep))
+        path = self._image_paths.get(relpath)
+        if path is None:
+            p = Path(relpath)
+            path = str(p if p.is_absolute() else self._social_img_base / p)
+            self._image_paths[relpath] = path
 
-        if not os.path.exists(path):
-            label.setPixmap(QPixmap())
-            label.setText(f"Image introuvable:\n{relpath}\n\n(double-clic pour choisir)")
+        # Un seul stat par chemin (existence + mtime pour la clé du cache), puis mémorisé
+        try:
+            mtime = self._image_mtimes[path]
+        except KeyError:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            self._image_mtimes[path] = mtime
+        if mtime is None:
+            label.show_placeholder(_TXT_MISSING.format(relpath))
             return
 
-        pix = QPixmap(path)
-        if pix.isNull():
-            label.setPixmap(QPixmap())
-            label.setText(f"Impossible de lire:\n{relpath}\n\n(double-clic)")
-            return
+        # QPixmapCache (process-wide, borné en Ko) : un avatar réutilisé n'est décodé qu'une
+        # fois pour toutes les pages ; un fichier modifié sur disque change de clé (mtime).
+        key = f"{path}|{mtime}"
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            pix = QPixmap(path)
+            if pix.isNull():
+                label.show_placeholder(_TXT_BAD.format(relpath))
+                return
+            QPixmapCache.insert(key, pix)
 
-        label.setText("")
-        label.set_original_pixmap(pix)
+        self._set_text(label, "")
+        label.set_original_pixmap(pix, cache_key=key)
+
+    @Slot(Qt.ApplicationState)
+    def _on_app_state_changed(self, app_state: Qt.ApplicationState) -> None:
+        if app_state == Qt.ApplicationActive:
+            self._image_mtimes.clear()
 
     def _pick_image_relpath(self, *, start_subdir: str = "") -> str | None:
-        return ClickableImageLabel.pick_image_relpath(
+        rel = ClickableImageLabel.pick_image_relpath(
             self,
             base_dir=self.social_img_dir,
             start_subdir=start_subdir,
-            settings_key="last_image_dir_social"
+            settings_key="last_image_dir_social",
+            fallback_dir=self._social_img_fallback,
         )
+        # Le dialogue a pu ajouter/remplacer des fichiers : les mtimes mémorisés sont périmés
+        self._image_mtimes.clear()
+        return rel
 
     def _pick_profile_image(self) -> None:
         profile_id = self._current_profile_id()
@@ -547,43 +795,161 @@ class SocialProfilePageBase(QWidget):
     # =========================================================
     # Profile changes
     # =========================================================
-    def _on_profile_changed(self, _text: str) -> None:
-        if self._building_ui:
+    @Slot(str)
+    def _on_profile_changed(self, text: str) -> None:
+        if self._ui_guard_depth:
             return
-        prof = self._current_profile_context()
+        prof = self._active_profile
         if not prof:
             return
-        prof["defaultDisplayName"] = self.le_display_name.text()
-        self.state.mark_dirty()
+        if self._defer_edit(prof, "defaultDisplayName", self.le_display_name.text, text):
+            self.state.mark_dirty()
 
     # =========================================================
     # Post field changes
     # =========================================================
+    @Slot()
     def _on_post_description_changed(self) -> None:
-        if self._building_ui:
+        if self._ui_guard_depth:
             return
-        post = self._current_post_context()
+        post = self._active_post
         if not post:
             return
-        post["description"] = self.te_description.toPlainText()
+        # toPlainText() copie tout le document : lu une fois au flush, pas à chaque touche
+        self._defer_edit(post, "description", self.te_description.toPlainText)
+        self.state.mark_dirty()  # dirty tout de suite : le texte sera écrit au flush
+
+    @Slot(str)
+    def _on_condition_changed(self, text: str) -> None:
+        if self._ui_guard_depth:
+            return
+        post = self._active_post
+        if not post:
+            return
+        if self._defer_edit(post, "conditionJS", self.le_condition.text, text):
+            self.state.mark_dirty()
+
+    @Slot(str)
+    def _on_effect_changed(self, text: str) -> None:
+        if self._ui_guard_depth:
+            return
+        post = self._active_post
+        if not post:
+            return
+        if self._defer_edit(post, "effectJs", self.le_effect.text, text):
+            self.state.mark_dirty()
+
+    def _defer_edit(
+        self, target: dict[str, Any], field: str, read: Callable[[], Any], value: Any = None
+    ) -> bool:
+        """
+        Programme l'écriture de `field` au prochain flush. Si `value` (valeur courante, quand
+        elle est gratuite à obtenir) est déjà celle stockée : rien à écrire, renvoie False.
+        """
+        if value is not None and target.get(field) == value:
+            self._pending_edits.pop(field, None)  # retour à la valeur stockée
+            return False
+        self._pending_edits[field] = (target, read)
+        self._edit_timer.start()
+        return True
+
+    @Slot()
+    def _flush_pending_edits(self) -> None:
+        """Écrit dans les données les saisies encore différées (avant refresh, save, export...)."""
+        self._edit_timer.stop()
+        pending = self._pending_edits
+        if not pending:
+            return
+        self._pending_edits = {}
+        for field, (target, read) in pending.items():
+            target[field] = read()
+
+    def _fit_description_height(self) -> None:
+        # Hauteur fixe = DESCRIPTION_LINES lignes ; recalculée seulement si la police change
+        line_height = self._line_spacing(self.te_description)
+        self.te_description.setFixedHeight(line_height * DESCRIPTION_LINES + 12)
+
+    def eventFilter(self, obj, event):
+        if obj is self.te_description:
+            etype = event.type()
+            if etype == QEvent.FocusOut:
+                self._flush_pending_edits()
+            elif etype == QEvent.FontChange:
+                self._fit_description_height()
+        return super().eventFilter(obj, event)
+
+    @Slot(int)
+    def _on_timeslot_changed(self, _index: int) -> None:
+        if self._ui_guard_depth:
+            return
+        post = self._active_post
+        if not post:
+            return
+        value = self.cb_timeslot.currentText()
+        if post.get("timeslot") == value:
+            return  # re-sélection de la même entrée : rien à écrire ni à salir
+        post["timeslot"] = value
         self.state.mark_dirty()
 
-    def _on_post_simple_changed(self, *_args) -> None:
-        if self._building_ui:
+    @Slot(int)
+    def _on_commentset_changed(self, _index: int) -> None:
+        if self._ui_guard_depth:
             return
-        post = self._current_post_context()
+        post = self._active_post
         if not post:
             return
+        value = self.cb_comment_set.currentText()
+        if post.get("commentsSet") == value:
+            return
+        post["commentsSet"] = value
+        self.state.mark_dirty()
+
+    @Slot(str)
+    def _on_lewd_min_changed(self, text: str) -> None:
+        self._write_lewd_bound("min", text, 0)
 
-        post["timeslot"] = self.cb_timeslot.currentText()
-        post["conditionJS"] = self.le_condition.text()
-        post["effectJs"] = self.le_effect.text()
-        post["commentsSet"] = self.cb_comment_set.currentText()
+    @Slot(str)
+    def _on_lewd_max_changed(self, text: str) -> None:
+        self._write_lewd_bound("max", text, INT_MAX)
+
+    def _write_lewd_bound(self, bound: str, text: str, default: int) -> None:
+        if self._ui_guard_depth:
+            return
+        post = self._active_post
+        if not post:
+            return
+        lewd = post.get("lewdCondition")
+        if not isinstance(lewd, dict):
+            lewd = post["lewdCondition"] = {"min": 0, "max": INT_MAX}
+        try:
+            value = int(text)
+        except ValueError:
+            value = default  # champ vidé => borne par défaut
+        if lewd.get(bound) == value:
+            return
+        lewd[bound] = value
         self.state.mark_dirty()
 
+    def _show_lewd_condition(self, post: dict[str, Any] | None) -> None:
+        """Affiche lewdCondition du post (champs vidés si aucun post)."""
+        if post is None:
+            self._set_text(self.le_lewd_min, "")
+            self._set_text(self.le_lewd_max, "")
+            return
+        lewd = post.get("lewdCondition")
+        if not isinstance(lewd, dict):
+            lewd = {}
+        self._set_text(self.le_lewd_min, str(lewd.get("min", 0)))
+        self._set_text(self.le_lewd_max, str(lewd.get("max", INT_MAX)))
+
     # =========================================================
     # Emoji preset logic (detach on edit)
     # =========================================================
+    def _select_timeslot(self, value: str) -> None:
+        """Lookup O(1) (libellé ou clé courte) au lieu du findText de setCurrentText ; inconnu => "all"."""
+        idx = TIME_SLOT_INDEX.get(value)
+        self.cb_timeslot.setCurrentIndex(TIME_SLOT_INDEX["all"] if idx is None else idx)
+
     def _select_emoji_preset(self, preset: str) -> None:
         with QSignalBlocker(self.cb_emoji_preset):
             if not preset:
@@ -593,37 +959,54 @@ class SocialProfilePageBase(QWidget):
             self.cb_emoji_preset.setCurrentIndex(idx if idx >= 0 else 0)
 
     def _set_emoji_values(self, data: dict[str, Any]) -> None:
-        with self._ui_guard():
-            for key in ("up", "down", "heart", "comment"):
-                vmin = int(data.get(key, {}).get("min", 0))
-                vmax = int(data.get(key, {}).get("max", 0))
-                if vmin > vmax:
-                    vmax = vmin
-                self.emoji_inputs[(key, "min")].setText(str(vmin))
-                self.emoji_inputs[(key, "max")].setText(str(vmax))
-
-    def _emoji_current_override_from_ui(self) -> dict[str, Any]:
-        out: dict[str, Any] = {}
-        for key in ("up", "down", "heart", "comment"):
-            tmin = (self.emoji_inputs[(key, "min")].text() or "").strip()
-            tmax = (self.emoji_inputs[(key, "max")].text() or "").strip()
-
-            vmin = int(tmin) if tmin.isdigit() else 0
-            vmax = int(tmax) if tmax.isdigit() else 0
+        if not self._emoji_grid_built:
+            return  # rien à afficher tant qu'aucun post n'a été ouvert
+        # Pas de guard ni de QSignalBlocker : les cellules n'écoutent que textEdited,
+        # que setText n'émet jamais (seule la frappe utilisateur le déclenche)
+        mins, maxs, shown = self._emoji_mins, self._emoji_maxs, self._emoji_bounds
+        set_text = self._set_text
+        for i, key in enumerate(self.EMOJI_KEYS):
+            bounds = data.get(key) or {}
+            vmin = int(bounds.get("min", 0))
+            vmax = int(bounds.get("max", 0))
             if vmin > vmax:
                 vmax = vmin
+            set_text(mins[i], str(vmin))
+            set_text(maxs[i], str(vmax))
+            cell = shown[i]
+            cell["min"] = vmin
+            cell["max"] = vmax
+
+    @staticmethod
+    def _emoji_le_int(le: QLineEdit) -> int:
+        # Le QIntValidator ne laisse passer que des chiffres (ou vide) : int() direct, une passe
+        try:
+            return int(le.text())
+        except ValueError:
+            return 0
+
+    def _parse_emoji_cell(self, index: int) -> None:
+        """Re-parse la seule cellule `index` (min/max) dans _emoji_bounds."""
+        vmin = self._emoji_le_int(self._emoji_mins[index])
+        vmax = self._emoji_le_int(self._emoji_maxs[index])
+        cell = self._emoji_bounds[index]
+        cell["min"] = vmin
+        cell["max"] = vmax if vmax >= vmin else vmin
 
-            out[key] = {"min": vmin, "max": vmax}
-        return out
+    def _emoji_current_override_from_ui(self) -> dict[str, Any]:
+        # Copie par cellule : l'override du post ne doit pas aliaser l'état de l'UI
+        return {key: dict(cell) for key, cell in zip(self.EMOJI_KEYS, self._emoji_bounds)}
 
+    @Slot(int)
     def _on_emoji_preset_selected(self, _index: int) -> None:
-        if self._building_ui:
+        if self._ui_guard_depth:
             return
-        post = self._current_post_context()
+        post = self._active_post
         if not post:
             return
 
         chosen = self.cb_emoji_preset.currentText()
+        self._pending_edits.pop("emojiOverride", None)  # la saisie différée est remplacée ici
 
         if chosen == "(custom)":
             post["emojiPreset"] = ""
@@ -631,44 +1014,63 @@ class SocialProfilePageBase(QWidget):
             self.state.mark_dirty()
             return
 
-        presets = self._emoji_presets()
-        if chosen in presets:
+        if post.get("emojiPreset") == chosen:
+            return  # déjà sur ce preset : override et cellules sont à jour
+
+        preset = self._emoji_presets().get(chosen)
+        if isinstance(preset, dict):
             post["emojiPreset"] = chosen
-            post["emojiOverride"] = presets[chosen]
+            # Copie par emoji : éditer le post (ou le preset) ne doit pas modifier l'autre
+            post["emojiOverride"] = {
+                key: dict(bounds) if isinstance(bounds, dict) else bounds
+                for key, bounds in preset.items()
+            }
             with self._ui_guard():
-                self._set_emoji_values(presets[chosen])
+                self._set_emoji_values(preset)
             self.state.mark_dirty()
 
-    def _on_emoji_value_changed(self, _key: str) -> None:
-        if self._building_ui:
+    @Slot(str)
+    def _on_any_emoji_edited(self, _text: str) -> None:
+        index = self.sender().property("emojiIndex")
+        self._parse_emoji_cell(index)
+        self._on_emoji_value_changed(self.EMOJI_KEYS[index])
+
+    def _on_emoji_value_changed(self, key: str) -> None:
+        if self._ui_guard_depth:
             return
 
-        post = self._current_post_context()
+        post = self._active_post
         if not post:
             return
 
-        # Récupère le post
-        chosen = self.cb_emoji_preset.currentText()
-        if chosen == "(custom)":
-            post["emojiOverride"] = self._emoji_current_override_from_ui()
-            post["emojiPreset"] = ""
-        else:
-            # Si on modifie manuellement, on repasse en custom
-            post["emojiOverride"] = self._emoji_current_override_from_ui()
-            post["emojiPreset"] = ""
-            with self._ui_guard():
-                self._select_emoji_preset("")
+        if "emojiOverride" not in self._pending_edits and not post.get("emojiPreset"):
+            # Déjà en custom et rien en attente : l'override stocké est à jour, on compare
+            stored = post.get("emojiOverride")
+            shown = self._emoji_bounds[self.EMOJI_KEYS.index(key)]
+            if isinstance(stored, dict) and stored.get(key) == shown:
+                return
+
+        # Rafale de frappes : l'override est relu des cellules une seule fois (_defer_edit) ;
+        # le détachement du preset reste immédiat pour que le combo suive la saisie
+        self._defer_edit(post, "emojiOverride", self._emoji_current_override_from_ui)
+        post["emojiPreset"] = ""
+        if self.cb_emoji_preset.currentIndex() != 0:
+            # Si on modifie manuellement, on repasse en custom (index 0 : pas de findText)
+            with self._ui_guard(), QSignalBlocker(self.cb_emoji_preset):
+                self.cb_emoji_preset.setCurrentIndex(0)
 
         self.state.mark_dirty()
 
+    @Slot()
     def _emoji_reset_custom(self) -> None:
-        post = self._current_post_context()
+        post = self._active_post
         if not post:
             return
 
+        self._pending_edits.pop("emojiOverride", None)
         post["emojiPreset"] = ""
         post["emojiOverride"] = self._default_emoji()
         with self._ui_guard():
             self._select_emoji_preset("")
-            self._set_emoji_values(self._default_emoji())
+            self._set_emoji_values(DEFAULT_EMOJI)
         self.state.mark_dirty()
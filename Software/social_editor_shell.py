@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QStackedWidget, QPushButton
@@ -107,6 +108,12 @@ ctx.flags["seen_" + ctx.postKey] = true;
 """
 
 TIME_SLOTS = ("morning 🌤️", "day 🏙️", "sunset 🌇", "night 🌃", "all ⚡")
+TIME_SLOT_KEYS = tuple(s.split()[0] for s in TIME_SLOTS)
+# Libellé ou clé ("night 🌃" / "night") -> index dans TIME_SLOTS, lecture seule
+TIME_SLOT_INDEX = MappingProxyType({
+    **{k: i for i, k in enumerate(TIME_SLOT_KEYS)},
+    **{s: i for i, s in enumerate(TIME_SLOTS)},
+})
 
 @dataclass(frozen=True)
 class ShellTexts:
@@ -163,6 +170,13 @@ class SocialEditorShell(QWidget):
 
         self._building_ui = False
 
+        # Dernier état appliqué aux boutons de mode (profile, post) : pas de setEnabled redondant
+        self._last_mode_state: tuple[bool, bool] | None = None
+
+        # Profil dont panel_posts affiche les posts (None = à reconstruire) :
+        # un re-clic sur le même profil ne refait pas la liste
+        self._last_loaded_profile: str | None = None
+
         # ======================
         # UI
         # ======================
@@ -188,7 +202,7 @@ class SocialEditorShell(QWidget):
             delete_label="Delete",
             confirm_delete=True,
             confirm_delete_title="Supprimer",
-            confirm_delete_builder=lambda sel: f"Supprimer le profil '{sel}' ?",
+            confirm_delete_builder="Supprimer le profil '{}' ?".format,
         )
         profiles_col.addWidget(self.panel_profiles, 1)
 
@@ -207,7 +221,7 @@ class SocialEditorShell(QWidget):
             delete_label="Delete",
             confirm_delete=True,
             confirm_delete_title="Supprimer",
-            confirm_delete_builder=lambda sel: f"Supprimer le post '{sel}' ?",
+            confirm_delete_builder="Supprimer le post '{}' ?".format,
         )
         posts_col.addWidget(self.panel_posts, 1)
 
@@ -257,8 +271,10 @@ class SocialEditorShell(QWidget):
         # ======================
         self.panel_profiles.selectionChanged.connect(self._handle_profile_clicked)
         self.panel_posts.selectionChanged.connect(self._handle_post_clicked)
-        self.panel_profiles.list.itemClicked.connect(lambda *_: self._handle_profile_clicked())
-        self.panel_posts.list.itemClicked.connect(lambda *_: self._handle_post_clicked())
+        # itemClicked ne sert qu'au re-clic sur l'item courant (selectionChanged ne part pas) ;
+        # un clic qui change la sélection est déjà traité par selectionChanged
+        self.panel_profiles.list.itemClicked.connect(self._on_profile_item_clicked)
+        self.panel_posts.list.itemClicked.connect(self._on_post_item_clicked)
 
         # ======================
         # CRUD
@@ -323,6 +339,7 @@ class SocialEditorShell(QWidget):
         if self._show_profiles_panel and not self._list_profiles:
             return
 
+        self._last_loaded_profile = None
         self._building_ui = True
         try:
             # Profiles (si visibles)
@@ -360,10 +377,22 @@ class SocialEditorShell(QWidget):
     def current_post_id(self) -> str | None:
         return self.panel_posts.current_text()
 
+    def set_post_editor(self, post_editor: QWidget) -> None:
+        """Remplace l'éditeur post (index 1), ex. placeholder -> éditeur construit à la demande."""
+        current = self.stack.currentIndex()
+        old = self.stack.widget(1)
+        self.stack.insertWidget(1, post_editor)
+        if old is not None:
+            self.stack.removeWidget(old)
+            old.deleteLater()
+        self.stack.setCurrentIndex(current)
+
+    @Slot()
     def show_profile_editor(self) -> None:
         self.stack.setCurrentIndex(0)
         self._sync_mode_buttons()
 
+    @Slot()
     def show_post_editor(self) -> None:
         # pas de post sélectionné => ne switch pas
         if not self.current_post_id():
@@ -398,16 +427,40 @@ class SocialEditorShell(QWidget):
             panel.btn_add.setEnabled(False)
 
     def _sync_mode_buttons(self) -> None:
-        has_post = bool(self.current_post_id())
-
-        # Si pas de post, on empêche d'aller sur l'éditeur post
-        self.btn_show_post.setEnabled(has_post)
+        # Lectures une seule fois, directement sur la liste (pas de chaîne current_post_id/current_text)
+        item = self.panel_posts.list.currentItem()
+        has_post = item is not None and bool(item.text())
 
+        # Si pas de post, on empêche d'aller sur l'éditeur post ;
         # feedback léger: désactive le bouton de la page courante
         idx = self.stack.currentIndex()
-        self.btn_show_profile.setEnabled(idx != 0)
-        self.btn_show_post.setEnabled(has_post and idx != 1)
+        state = (idx != 0, has_post and idx != 1)
+        if state == self._last_mode_state:
+            return
+        self._last_mode_state = state
+
+        self.btn_show_profile.setEnabled(state[0])
+        self.btn_show_post.setEnabled(state[1])
+
+    @Slot()
+    def _on_profile_item_clicked(self) -> None:
+        # Déjà en vue profil, sans post, sur ce profil : rien à refaire
+        if (
+            self.stack.currentIndex() == 0
+            and self.current_post_id() is None
+            and self.current_profile_id() == self._last_loaded_profile
+        ):
+            return
+        self._handle_profile_clicked()
 
+    @Slot()
+    def _on_post_item_clicked(self) -> None:
+        # Éditeur post déjà affiché (pour ce post) : rien à refaire
+        if self.stack.currentIndex() == 1:
+            return
+        self._handle_post_clicked()
+
+    @Slot()
     def _handle_profile_clicked(self) -> None:
         # Si le ruban profiles est caché, on ignore (sécurité)
         if not self._show_profiles_panel:
@@ -420,17 +473,21 @@ class SocialEditorShell(QWidget):
         self.profileSelected.emit(prof)
 
         # Rebuild posts list for this profile
-        if self._list_posts and prof:
+        if prof and prof == self._last_loaded_profile:
+            # Même profil (re-clic, ou itemClicked + selectionChanged) : on désélectionne seulement
+            self.clear_post_selection()
+        elif self._list_posts and prof:
             self._building_ui = True
             try:
                 posts = self._list_posts(prof)
-                self.panel_posts.set_items(posts, preserve_selection=False)
-                self.clear_post_selection()
+                # Liste reconstruite d'un bloc, sans sélection (pas de select puis clear)
+                self.panel_posts.set_items(posts, preserve_selection=False, select_first=False)
+                self._last_loaded_profile = prof
             finally:
                 self._building_ui = False
         else:
+            self._last_loaded_profile = None
             self.panel_posts.set_items([], preserve_selection=False)
-            self.clear_post_selection()
 
         # Switch editor to profile view
         self.show_profile_editor()
@@ -445,6 +502,7 @@ class SocialEditorShell(QWidget):
 
         self._sync_mode_buttons()
 
+    @Slot()
     def _handle_post_clicked(self) -> None:
         if self._building_ui:
             return
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
-from PySide6.QtCore import QObject, Signal
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Dict, Iterator
+from PySide6.QtCore import QObject, Signal, QTimer
 
 
 def default_data() -> Dict[str, Any]:
@@ -17,58 +19,206 @@ def default_data() -> Dict[str, Any]:
     }
 
 
+def _normalize_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Complète une fois au chargement les clés absentes ou null (racine, profils, "posts").
+    Les valeurs d'un autre type sont laissées telles quelles : le validateur doit pouvoir les signaler.
+    """
+    for key, default in default_data().items():
+        if data.get(key) is None:
+            data[key] = default
+
+    profiles = data["profiles"]
+    if isinstance(profiles, dict):
+        for pid, prof in profiles.items():
+            if prof is None:
+                prof = profiles[pid] = {}
+            if isinstance(prof, dict) and prof.get("posts") is None:
+                prof["posts"] = {}
+
+    heroine = data["heroine"]
+    if isinstance(heroine, dict) and heroine.get("posts") is None:
+        heroine["posts"] = {}
+    return data
+
+
 class AppState(QObject):
     dataChanged = Signal()
     dirtyChanged = Signal(bool)
+    # Demande aux éditeurs d'écrire leurs saisies différées (voir flush_pending_edits)
+    flushRequested = Signal()
 
     def __init__(self) -> None:
         super().__init__()
         self.data: Dict[str, Any] = default_data()
         self.current_path: str | None = None
         self.is_dirty: bool = False
+        # Incrémenté à chaque modification (mark_dirty / set_data) : empreinte O(1) des données
+        self.revision: int = 0
+
+        # Regroupe les mark_dirty() d'une même itération de la boucle Qt :
+        # une rafale de frappes => une seule émission de dirtyChanged.
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(0)
+        self._dirty_timer.timeout.connect(self._flush_dirty)
+
+        # Idem pour dataChanged : notify_changed() => une seule émission par tour de boucle,
+        # et aucune pendant un batch_changes() (une seule à la sortie)
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.dataChanged.emit)
+        self._batch_depth = 0
+        self._batch_pending = False
+
+        # (revision, liste plate des posts) : valable tant que revision n'a pas bougé
+        self._posts_cache: tuple[int, list[Dict[str, Any]]] | None = None
+        # Index de références, même règle : clé ("posts"|"blocks", champ) ->
+        # (revision, valeur -> dicts qui la référencent). Un rename = O(références), pas O(posts).
+        self._ref_index: dict[tuple[str, str], tuple[int, dict[str, list[Dict[str, Any]]]]] = {}
 
     def set_data(self, new_data: Dict[str, Any], path: str | None = None) -> None:
-        self.data = new_data if isinstance(new_data, dict) else default_data()
+        self.data = _normalize_data(new_data) if isinstance(new_data, dict) else default_data()
         self.current_path = path
+        self.revision += 1
         self.set_dirty(False)  # Charger = pas dirty
         self.dataChanged.emit()
 
     def set_dirty(self, value: bool) -> None:
-        value = bool(value)
-        if self.is_dirty == value:
+        if self.is_dirty is value:
             return
+        self._dirty_timer.stop()
         self.is_dirty = value
         self.dirtyChanged.emit(self.is_dirty)
 
     def mark_dirty(self) -> None:
-        self.set_dirty(True)
+        """
+        Marque dirty tout de suite (is_dirty fiable pour save/close),
+        mais l'émission de dirtyChanged est différée au prochain tour de boucle.
+        """
+        self.revision += 1
+        if self.is_dirty:
+            return
+        self.is_dirty = True
+        self._dirty_timer.start()
+
+    def _flush_dirty(self) -> None:
+        self.dirtyChanged.emit(self.is_dirty)
+
+    def flush_pending_edits(self) -> None:
+        """
+        Force l'écriture des saisies encore en attente dans les éditeurs (debounce).
+        À appeler avant de lire self.data pour l'écrire ailleurs (save, export...).
+        """
+        self.flushRequested.emit()
+
+    def notify_changed(self) -> None:
+        """
+        Demande un dataChanged (refresh de toutes les pages).
+        Les appels d'un même tour de boucle sont regroupés en une seule émission.
+        """
+        if self._batch_depth:
+            self._batch_pending = True
+            return
+        self._changed_timer.start()
+
+    @contextmanager
+    def batch_changes(self):
+        """
+        Regroupe les notify_changed() du bloc : un seul dataChanged, émis à la sortie.
+        Réentrant (seul le batch le plus externe émet).
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self._changed_timer.stop()
+                self.dataChanged.emit()
 
     # =========================================================
     # Referential integrity helpers (rename + propagation)
     # =========================================================
 
-    def _emit_changed(self) -> None:
-        """Marque dirty + rafraîchit toutes les pages (dataChanged)."""
-        self.mark_dirty()
-        self.dataChanged.emit()
-
-    def _iter_all_posts(self):
+    def _iter_all_posts(self) -> Iterator[Dict[str, Any]]:
         """
         Itère sur tous les posts (public profiles + heroine).
-        Yields: post_dict
+        Clés complétées par _normalize_data (set_data) ; les valeurs d'un mauvais type
+        (signalées par le validateur) sont ignorées. Le parcours (chain + filter) reste côté C.
+        """
+        profiles = self.data["profiles"]
+        heroine = self.data["heroine"]
+        containers = chain(
+            (prof.get("posts") for prof in profiles.values() if isinstance(prof, dict))
+            if isinstance(profiles, dict) else (),
+            (heroine.get("posts"),) if isinstance(heroine, dict) else (),
+        )
+        posts = chain.from_iterable(c.values() for c in containers if isinstance(c, dict))
+        return filter(dict.__instancecheck__, posts)
+
+    def _all_posts(self) -> list[Dict[str, Any]]:
+        """
+        Liste plate de tous les posts, matérialisée une fois par revision :
+        toute modification passe par mark_dirty/set_data (revision += 1) et l'invalide.
         """
-        profiles = self.data.get("profiles", {}) or {}
-        for _, prof in profiles.items():
-            posts = (prof or {}).get("posts", {}) or {}
-            for _, post in posts.items():
-                if isinstance(post, dict):
-                    yield post
+        cache = self._posts_cache
+        if cache is not None and cache[0] == self.revision:
+            return cache[1]
+        posts = list(self._iter_all_posts())
+        self._posts_cache = (self.revision, posts)
+        return posts
 
-        heroine = self.data.get("heroine", {}) or {}
-        h_posts = heroine.get("posts", {}) or {}
-        for _, post in h_posts.items():
-            if isinstance(post, dict):
-                yield post
+    def _all_blocks(self) -> list[Dict[str, Any]]:
+        blocks = self.data.get("commentBlocks", {}) or {}
+        return [b for b in blocks.values() if isinstance(b, dict)]
+
+    def _refs_by(self, kind: str, field: str) -> dict[str, list[Dict[str, Any]]]:
+        """valeur de `field` -> dicts (posts ou blocks) qui la portent ; une passe par revision."""
+        entry = self._ref_index.get((kind, field))
+        if entry is not None and entry[0] == self.revision:
+            return entry[1]
+        index: dict[str, list[Dict[str, Any]]] = {}
+        for d in self._all_posts() if kind == "posts" else self._all_blocks():
+            value = d.get(field)
+            if isinstance(value, str):
+                index.setdefault(value, []).append(d)
+        self._ref_index[(kind, field)] = (self.revision, index)
+        return index
+
+    def _rename_refs(self, kind: str, field: str, old: str, new: str) -> None:
+        """[kind][*][field] old -> new, puis dataChanged. Ne change que ce champ."""
+        index = self._refs_by(kind, field)
+        matches = index.pop(old, None)
+        if matches:
+            for d in matches:
+                d[field] = new
+            index.setdefault(new, []).extend(matches)
+
+        rev = self.revision
+        self.mark_dirty()
+        # Un rename ne crée ni ne supprime rien et ne touche que `field` : les caches valides
+        # avant le restent (renames en série). Re-datés avant dataChanged : une modif faite
+        # par un handler les invalidera normalement.
+        # notify_changed : plusieurs renames d'affilée => un seul dataChanged.
+        if self._posts_cache is not None and self._posts_cache[0] == rev:
+            self._posts_cache = (self.revision, self._posts_cache[1])
+        for key, (entry_rev, entry) in self._ref_index.items():
+            if entry_rev == rev:
+                self._ref_index[key] = (self.revision, entry)
+        self.notify_changed()
+
+    @staticmethod
+    def rename_key(d: Dict[str, Any], old: str, new: str) -> None:
+        """
+        d[old] -> d[new] à la même position (pop + set l'enverrait en fin : ordre du JSON
+        et des listes non triées bouleversé). Réécrit sur place : les références à d restent valides.
+        """
+        items = list(d.items())
+        d.clear()
+        d.update((new if k == old else k, v) for k, v in items)
 
     def rename_username_pool(self, old: str, new: str) -> bool:
         """
@@ -86,14 +236,8 @@ class AppState(QObject):
         if new in pools:
             return False
 
-        pools[new] = pools.pop(old)
-
-        blocks = self.data.get("commentBlocks", {}) or {}
-        for _, b in blocks.items():
-            if isinstance(b, dict) and b.get("usernamePool") == old:
-                b["usernamePool"] = new
-
-        self._emit_changed()
+        self.rename_key(pools, old, new)
+        self._rename_refs("blocks", "usernamePool", old, new)
         return True
 
     def rename_comment_set(self, old: str, new: str) -> bool:
@@ -112,13 +256,8 @@ class AppState(QObject):
         if new in sets_:
             return False
 
-        sets_[new] = sets_.pop(old)
-
-        for post in self._iter_all_posts():
-            if post.get("commentsSet") == old:
-                post["commentsSet"] = new
-
-        self._emit_changed()
+        self.rename_key(sets_, old, new)
+        self._rename_refs("posts", "commentsSet", old, new)
         return True
 
     def rename_emoji_preset(self, old: str, new: str) -> bool:
@@ -137,11 +276,6 @@ class AppState(QObject):
         if new in presets:
             return False
 
-        presets[new] = presets.pop(old)
-
-        for post in self._iter_all_posts():
-            if post.get("emojiPreset") == old:
-                post["emojiPreset"] = new
-
-        self._emit_changed()
+        self.rename_key(presets, old, new)
+        self._rename_refs("posts", "emojiPreset", old, new)
         return True
@@ -33,14 +33,18 @@ class ThemeManager:
                 "light_cyan.xml",
                 "light_purple.xml",
             ]
+        self.set_theme_index(self.theme_index)
+
+    def _themes(self) -> list[str]:
+        return self.themes_dark if self.is_dark else self.themes_light
 
     def current_theme_file(self) -> str:
-        themes = self.themes_dark if self.is_dark else self.themes_light
-        idx = max(0, min(self.theme_index, len(themes) - 1))
-        return themes[idx]
+        # theme_index est borné par les setters : accès direct
+        return self._themes()[self.theme_index]
 
     def set_dark(self, value: bool) -> None:
         self.is_dark = bool(value)
+        self.set_theme_index(self.theme_index)  # les deux listes peuvent différer en taille
 
     def set_theme_index(self, idx: int) -> None:
-        self.theme_index = int(idx)
+        self.theme_index = max(0, min(int(idx), len(self._themes()) - 1))
@@ -1,33 +1,66 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Container
 import json
+import os
 
-from PySide6.QtCore import ( Qt, Signal, QEvent, QMimeData )
+from PySide6.QtCore import ( Qt, Signal, QEvent, QMimeData, QTimer, QSignalBlocker )
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QPushButton, QLineEdit,
+    QListWidget, QListView, QPushButton, QLineEdit,
     QAbstractItemView, QMessageBox, QInputDialog,
-    QApplication, QComboBox, QLabel
+    QApplication, QComboBox, QLabel, QFileDialog
 )
-from PySide6.QtGui import QKeySequence, QKeyEvent, QShortcut
+from PySide6.QtGui import QKeySequence, QKeyEvent, QShortcut, QPixmap, QPixmapCache
 from PySide6.QtCore import QSettings
 from pathlib import Path
 
+# Presse-papier ListPanel : orjson si installé (bytes directs, C), sinon json standard
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads  # accepte aussi les bytes
+
 class AppSettings:
     """
     Gestion des settings persistants de l'app
     """
+    # Une seule instance pour toute l'app (pas de re-lecture registre/INI à chaque accès)
     _settings = QSettings("Unifox", "SocialPostEditor")
+    # Valeurs déjà lues/écrites : lecture = lookup dict, écriture identique = rien
+    _cache: dict[str, str] = {}
+
+    @classmethod
+    def get_last_dir(cls, key: str = "last_image_dir") -> str:
+        val = cls._cache.get(key)
+        if val is None:
+            val = cls._cache[key] = cls._settings.value(key, "", type=str)
+        return val
+
+    @classmethod
+    def set_last_dir(cls, key: str, path: str) -> None:
+        if cls._cache.get(key) == path:
+            return
+        cls._cache[key] = path
+        # setValue reste en mémoire : QSettings écrit sur disque plus tard (boucle d'événements)
+        cls._settings.setValue(key, path)
+
+    @classmethod
+    def sync(cls) -> None:
+        """Écrit les valeurs en attente (à la fermeture : l'instance de classe meurt après QApplication)."""
+        cls._settings.sync()
 
     @classmethod
     def get_last_image_dir(cls) -> Path | None:
-        val = cls._settings.value("last_image_dir", "")
+        val = cls.get_last_dir("last_image_dir")
         return Path(val) if val else None
 
     @classmethod
     def set_last_image_dir(cls, path: Path) -> None:
-        cls._settings.setValue("last_image_dir", str(path))
+        cls.set_last_dir("last_image_dir", str(path))
         
 class ListPanel(QWidget):
     addRequested = Signal(str)
@@ -63,27 +96,40 @@ class ListPanel(QWidget):
         self._confirm_delete_builder = confirm_delete_builder
 
         self.list = QListWidget()
+        # Layout par lots : les longues listes s'affichent sans mesurer toutes les rows d'un coup.
+        # Hauteur uniforme (une seule mesure) sauf pour les panels à textes multi-lignes.
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setBatchSize(64)
+        if not self._is_multiline_placeholder(placeholder):
+            self.list.setUniformItemSizes(True)
         self.list.installEventFilter(self)
         self.list.viewport().installEventFilter(self)
         self.list.setFocusPolicy(Qt.StrongFocus)
         
         self._clipboard_pack_fn = None
         self._clipboard_paste_fn = None
-        
-        self._sc_copy = QShortcut(QKeySequence.Copy, self)
-        self._sc_copy.setContext(Qt.WidgetWithChildrenShortcut)
-        self._sc_copy.activated.connect(self._on_copy)
-        
-        self._sc_paste = QShortcut(QKeySequence.Paste, self)
-        self._sc_paste.setContext(Qt.WidgetWithChildrenShortcut)
-        self._sc_paste.activated.connect(self._on_paste)
-        
-        self._sc_delete = QShortcut(QKeySequence.Delete, self)
-        self._sc_delete.setContext(Qt.WidgetWithChildrenShortcut)
-        self._sc_delete.activated.connect(self._on_delete_clicked)
+        self._clipboard_paste_raw = False
+
+        # Index texte -> row (reconstruit à la demande, invalidé à chaque
+        # modification du modèle : ajout/suppression/déplacement/renommage)
+        self._name_to_row: dict[str, int] | None = None
+        # Copie des items du dernier set_items (None dès que le modèle bouge autrement)
+        self._last_items: list[str] | None = None
+        model = self.list.model()
+        model.rowsInserted.connect(self._invalidate_index)
+        model.rowsRemoved.connect(self._invalidate_index)
+        model.rowsMoved.connect(self._invalidate_index)
+        model.modelReset.connect(self._invalidate_index)
+        model.dataChanged.connect(self._invalidate_index)
+
+        # Copy/Paste/Delete : créés au 1er focus dans le panel (voir eventFilter). Contexte
+        # WidgetWithChildrenShortcut => inactifs sans focus de toute façon, et les panels
+        # jamais utilisés n'encombrent pas le gestionnaire de raccourcis.
+        self._shortcuts_ready = False
 
         self.input = QLineEdit()
         self.input.setPlaceholderText(placeholder)
+        self.input.installEventFilter(self)
 
         self.btn_edit = QPushButton(edit_label)
         self.btn_delete = QPushButton(delete_label)
@@ -117,11 +163,19 @@ class ListPanel(QWidget):
         self._update_action_enabled()
 
     @staticmethod
-    def make_unique_name(base: str, exists: Callable[[str], bool]) -> str:
+    def make_unique_name(
+        base: str,
+        exists: Callable[[str], bool] | None = None,
+        *,
+        existing: Container[str] | None = None,
+    ) -> str:
         """
         Génère un nom unique à partir de base.
         Ex: "Omega" -> "Omega_Copy" -> "Omega_Copy2" ...
+        existing : conteneur des noms pris (dict/set) => test `in` direct, sans lambda ni copie.
         """
+        if existing is not None:
+            exists = existing.__contains__
         base = (base or "").strip()
         if not base:
             base = "Item"
@@ -137,13 +191,19 @@ class ListPanel(QWidget):
                 return candidate
             i += 1
 
-    def set_clipboard_handlers(self, *, pack=None, paste=None):
+    def set_clipboard_handlers(self, *, pack=None, paste=None, raw_paste: bool = False):
         """
-        pack  : callable() -> dict | None
+        pack  : callable() -> dict | bytes | None
+                (le payload est sérialisé en JSON immédiatement : il peut
+                 référencer les données live, aucune copie n'est nécessaire ;
+                 des bytes déjà sérialisés sont posés tels quels, sans aller-retour JSON)
         paste : callable(dict) -> None
+                (reçoit un objet fraîchement désérialisé, utilisable tel quel ;
+                 raw_paste=True : reçoit les bytes bruts du presse-papier)
         """
         self._clipboard_pack_fn = pack
         self._clipboard_paste_fn = paste
+        self._clipboard_paste_raw = raw_paste
 
     def _on_copy(self):
         clipboard = QApplication.clipboard()
@@ -153,10 +213,9 @@ class ListPanel(QWidget):
             payload = self._clipboard_pack_fn()
             if payload is not None:
                 mime = QMimeData()
-                mime.setData(
-                    self.MIME,
-                    json.dumps(payload).encode("utf-8")
-                )
+                if not isinstance(payload, (bytes, bytearray)):
+                    payload = _json_dumps(payload)
+                mime.setData(self.MIME, payload)
                 clipboard.setMimeData(mime)
                 return
 
@@ -172,16 +231,15 @@ class ListPanel(QWidget):
         # Mode OBJET
         if (
             self._clipboard_paste_fn
+            and mime is not None
             and mime.hasFormat(self.MIME)
         ):
-            payload = json.loads(
-                bytes(mime.data(self.MIME)).decode("utf-8")
-            )
-            self._clipboard_paste_fn(payload)
+            payload = bytes(mime.data(self.MIME))
+            self._clipboard_paste_fn(payload if self._clipboard_paste_raw else _json_loads(payload))
             return
 
-        # Fallback TEXTE
-        text = clipboard.text()
+        # Fallback TEXTE : lu sur le même QMimeData (pas de 2e requête au propriétaire du presse-papier)
+        text = mime.text() if mime is not None else ""
         if text:
             self.addRequested.emit(text.strip())
 
@@ -212,10 +270,12 @@ class ListPanel(QWidget):
         if on_rows_moved is not None:
             self.rowsMoved.connect(on_rows_moved)
 
-    def set_items(self, items: list[str], *, preserve_selection: bool = True) -> None:
+    def set_items(
+        self, items: list[str], *, preserve_selection: bool = True, select_first: bool = True
+    ) -> None:
         """
         Remplit la liste sans effet "reset" agressif :
-        - préserve la sélection si possible
+        - préserve la sélection si possible (sinon 1er item, ou aucun si select_first=False)
         - préserve la position de scroll
         - bloque les signaux pendant TOUTE la mise à jour
         - n'émet selectionChanged que si la sélection a réellement changé
@@ -230,26 +290,38 @@ class ListPanel(QWidget):
         target_text: str | None = None
         if prev_text and prev_text in items:
             target_text = prev_text
-        elif items:
+        elif items and select_first:
             target_text = items[0]
 
-        # Mise à jour silencieuse
-        from PySide6.QtCore import QSignalBlocker
-        with QSignalBlocker(self.list):
-            self.list.clear()
-            self.list.addItems(items)
-
-            if target_text:
-                found = self.list.findItems(target_text, Qt.MatchExactly)
-                if found:
-                    self.list.setCurrentItem(found[0])
-                else:
-                    # Fallback sécurité
-                    if self.list.count() > 0:
-                        self.list.setCurrentRow(0)
+        # Refresh sans effet (même contenu, sélection conservée) : pas de rebuild
+        if preserve_selection and target_text == prev_text and items == self._last_items:
+            return
 
-        # Restaure le scroll (clamp au max)
-        sb.setValue(min(prev_scroll, sb.maximum()))
+        # Mise à jour silencieuse, et sans repaint intermédiaire (liste vide, saut de scroll)
+        self.list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.list):
+                self.list.clear()
+                self.list.addItems(items)
+                # Index texte -> row tiré directement de `items` (zip côté C, 1re occurrence gagne),
+                # au lieu de le relire item par item dans le widget
+                n = len(items)
+                self._name_to_row = dict(zip(reversed(items), range(n - 1, -1, -1)))
+
+                if target_text:
+                    row = self.index_of(target_text)
+                    if row >= 0:
+                        self.list.setCurrentRow(row)
+                    else:
+                        # Fallback sécurité
+                        if self.list.count() > 0:
+                            self.list.setCurrentRow(0)
+
+            # Restaure le scroll (clamp au max)
+            sb.setValue(min(prev_scroll, sb.maximum()))
+        finally:
+            self.list.setUpdatesEnabled(True)
+        self._last_items = list(items)  # après le rebuild : ses propres signaux l'ont invalidé
 
         # Boutons edit/delete
         self._update_action_enabled()
@@ -263,6 +335,45 @@ class ListPanel(QWidget):
         item = self.list.currentItem()
         return item.text() if item else None
 
+    def index_of(self, text: str) -> int:
+        """Row du premier item dont le texte vaut exactement `text` (-1 si absent). O(1) amorti."""
+        index = self._name_to_row
+        if index is None:
+            index = {}
+            for row in range(self.list.count() - 1, -1, -1):
+                index[self.list.item(row).text()] = row
+            self._name_to_row = index
+        return index.get(text, -1)
+
+    def rename_item(self, old: str, new: str) -> bool:
+        """
+        Renomme l'item `old` sur place (même row, même sélection, pas de rebuild).
+        Retourne False si `old` est absent.
+        """
+        row = self.index_of(old)
+        if row < 0:
+            return False
+        index = self._name_to_row
+        unique = index is not None and len(index) == self.list.count()
+        self.list.item(row).setText(new)  # dataChanged => index invalidé
+
+        # Noms uniques : on patche l'index au lieu de le reconstruire
+        if unique and new not in index:
+            del index[old]
+            index[new] = row
+            self._name_to_row = index
+        return True
+
+    def select_text(self, text: str, *, scroll: bool = True) -> bool:
+        """Sélectionne l'item `text` via l'index (pas de findItems). Retourne False si absent."""
+        row = self.index_of(text)
+        if row < 0:
+            return False
+        self.list.setCurrentRow(row)
+        if scroll:
+            self.list.scrollToItem(self.list.item(row))
+        return True
+
     def clear_input(self) -> None:
         self.input.clear()
 
@@ -296,10 +407,7 @@ class ListPanel(QWidget):
         # - Pour un usage général (ids, noms) : champ simple
         # - Pour les panels qui stockent des textes (comments etc.), on préfère multi-ligne
         #   Heuristique simple : si placeholder contient "paste multiple lines" ou "multiple lines"
-        ph = (self.input.placeholderText() or "").lower()
-        wants_multiline = ("multiple lines" in ph) or ("multi-lines" in ph) or ("multilines" in ph)
-
-        if wants_multiline:
+        if self._is_multiline_placeholder(self.input.placeholderText()):
             text, ok = QInputDialog.getMultiLineText(
                 self,
                 "Edit",
@@ -329,6 +437,31 @@ class ListPanel(QWidget):
 
 
 
+    @staticmethod
+    def _is_multiline_placeholder(placeholder: str | None) -> bool:
+        ph = (placeholder or "").lower()
+        return ("multiple lines" in ph) or ("multi-lines" in ph) or ("multilines" in ph)
+
+    def _invalidate_index(self, *_args) -> None:
+        self._name_to_row = None
+        self._last_items = None
+
+    def eventFilter(self, obj, event) -> bool:
+        if not self._shortcuts_ready and event.type() == QEvent.FocusIn:
+            self._build_shortcuts()
+        return super().eventFilter(obj, event)
+
+    def _build_shortcuts(self) -> None:
+        self._shortcuts_ready = True
+        for seq, slot in (
+            (QKeySequence.Copy, self._on_copy),
+            (QKeySequence.Paste, self._on_paste),
+            (QKeySequence.Delete, self._on_delete_clicked),
+        ):
+            sc = QShortcut(seq, self)
+            sc.setContext(Qt.WidgetWithChildrenShortcut)
+            sc.activated.connect(slot)
+
     def _update_action_enabled(self) -> None:
         has_sel = self.list.currentItem() is not None
         self.btn_edit.setEnabled(has_sel)
@@ -368,6 +501,9 @@ class NoWheelComboBox(QComboBox):
 
 class ClickableImageLabel(QLabel):
     """QLabel image cliquable (double-clic) pour picker une image."""
+    # En dessous de cette taille (px, sur un côté), le lissage ne se voit pas
+    FAST_TRANSFORM_MAX_SIDE = 64
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
@@ -378,29 +514,110 @@ class ClickableImageLabel(QLabel):
 
         # ✅ cache le pixmap original pour rescaler proprement
         self._pix_original: QPixmap | None = None
+        # Dernier rendu (w, h, pixmap) : un resize à taille identique ne rescale pas
+        self._scaled_cache: tuple[int, int, QPixmap] | None = None
+        self._transform_mode: Qt.TransformationMode | None = None
+        # Clé QPixmapCache de l'original : les réductions y sont partagées (une par taille)
+        self._cache_key: str | None = None
+
+        # Regroupe les resizeEvent d'un redimensionnement interactif : un seul rescale à la fin
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self._apply_scaled)
+
+    def show_placeholder(self, text: str) -> None:
+        """Remplace l'image par un texte ; no-op si ce texte est déjà affiché (sans image)."""
+        self._resize_timer.stop()
+        self._pix_original = None  # sinon un resize ré-afficherait l'ancienne image
+        self._cache_key = None
+        self._scaled_cache = None
+        if self.text() != text:
+            self.setText(text)  # QLabel.setText efface aussi le pixmap affiché
+        elif not self.pixmap().isNull():
+            self.setPixmap(QPixmap())
 
     def mouseDoubleClickEvent(self, event):
         if callable(self.on_double_click):
             self.on_double_click()
         super().mouseDoubleClickEvent(event)
 
-    def set_original_pixmap(self, pix: QPixmap | None) -> None:
-        """Stocke l'original et affiche en mode 'contain' (shrunk)."""
+    def set_original_pixmap(
+        self,
+        pix: QPixmap | None,
+        transform_mode: Qt.TransformationMode | None = None,
+        cache_key: str | None = None,
+    ) -> None:
+        """
+        Stocke l'original et affiche en mode 'contain' (shrunk).
+        transform_mode=None => FastTransformation pour les petites vignettes, Smooth sinon.
+        cache_key : identifiant stable de l'original ; la version réduite est alors gardée dans
+        QPixmapCache et réutilisée au prochain affichage à la même taille (pas de re-scaled()).
+        Même cache_key que l'image affichée => rien à faire (re-sélection du même post/profil).
+        """
+        if (
+            cache_key is not None
+            and cache_key == self._cache_key
+            and transform_mode == self._transform_mode
+            and not self.pixmap().isNull()
+        ):
+            return
         self._pix_original = pix
+        self._transform_mode = transform_mode
+        self._cache_key = cache_key
+        self._scaled_cache = None
         self._apply_scaled()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._apply_scaled()
+        # Redimensionnement interactif (resize déjà en attente) : aperçu Fast immédiat,
+        # le rendu lissé arrive une fois les resize terminés (timer)
+        if self._resize_timer.isActive():
+            self._apply_scaled(preview=True)
+        self._resize_timer.start()
+
+    def _apply_scaled(self, preview: bool = False) -> None:
+        pix = self._pix_original
+        if not pix or pix.isNull():
+            return
 
-    def _apply_scaled(self) -> None:
-        if not self._pix_original or self._pix_original.isNull():
+        w, h = self.width(), self.height()
+        cache = self._scaled_cache
+        if cache is not None and cache[0] == w and cache[1] == h:
+            return  # déjà affiché à cette taille
+
+        # Comparaisons et réduction en pixels physiques (écrans HiDPI)
+        dpr = self.devicePixelRatioF()
+        tw, th = round(w * dpr), round(h * dpr)
+        if pix.width() <= tw and pix.height() <= th:
+            # Tient déjà dans le label : mode 'contain' => pas de rescale (jamais d'agrandissement),
+            # copie annotée du ratio pour s'afficher à sa taille physique native
+            scaled = QPixmap(pix)
+            scaled.setDevicePixelRatio(dpr)
+        elif preview:
+            # Aperçu jetable : pas dans QPixmapCache, et _scaled_cache vidé pour que le rendu
+            # lissé du timer ne soit pas court-circuité (même taille en fin de rafale)
+            scaled = pix.scaled(tw, th, Qt.KeepAspectRatio, Qt.FastTransformation)
+            scaled.setDevicePixelRatio(dpr)
+            self._scaled_cache = None
+            self.setPixmap(scaled)
             return
-        scaled = self._pix_original.scaled(
-            self.width(), self.height(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        else:
+            mode = self._transform_mode
+            if mode is None:
+                small = min(w, h) <= self.FAST_TRANSFORM_MAX_SIDE
+                mode = Qt.FastTransformation if small else Qt.SmoothTransformation
+
+            # Réduit en pixels physiques puis annote le ratio
+            key = f"{self._cache_key}@{tw}x{th}:{mode.name}" if self._cache_key else None
+            scaled = QPixmapCache.find(key) if key else None
+            if scaled is None:
+                scaled = pix.scaled(tw, th, Qt.KeepAspectRatio, mode)
+                scaled.setDevicePixelRatio(dpr)
+                if key:
+                    QPixmapCache.insert(key, scaled)
+
+        self._scaled_cache = (w, h, scaled)
         self.setPixmap(scaled)
         
     @staticmethod
@@ -409,21 +626,23 @@ class ClickableImageLabel(QLabel):
         *,
         base_dir: str,
         start_subdir: str = "",
-        settings_key: str = "last_image_dir"
+        settings_key: str = "last_image_dir",
+        fallback_dir: str | None = None,
     ) -> str | None:
         """
         Ouvre un file dialog et retourne un chemin relatif à base_dir (slash '/').
         Retient le dernier dossier ouvert via QSettings.
+        fallback_dir : dossier de repli déjà validé par l'appelant (évite de re-tester base_dir).
         """
-        settings = QSettings("Unifox", "SocialPostEditor")
-
         # Dossier par défaut
         default_dir = os.path.join(base_dir, start_subdir) if start_subdir else base_dir
         if not os.path.isdir(default_dir):
-            default_dir = base_dir if os.path.isdir(base_dir) else os.getcwd()
+            if fallback_dir is None:
+                fallback_dir = base_dir if os.path.isdir(base_dir) else os.getcwd()
+            default_dir = fallback_dir
 
         # Dernier dossier (persistant)
-        last_dir = settings.value(settings_key, "", type=str)
+        last_dir = AppSettings.get_last_dir(settings_key)
         start_dir = last_dir if last_dir and os.path.isdir(last_dir) else default_dir
 
         file_path, _ = QFileDialog.getOpenFileName(
@@ -436,7 +655,7 @@ class ClickableImageLabel(QLabel):
             return None
 
         # Mémorise le dossier choisi
-        settings.setValue(settings_key, os.path.dirname(file_path))
+        AppSettings.set_last_dir(settings_key, os.path.dirname(file_path))
 
         # Relatif à base_dir
         try: